@@ -1,5 +1,19 @@
-
 #2a)Write a program to create a menu with addition, subtraction, multiplication, and division.
+import ast
+import csv
+import math
+import os
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def add(x, y):
     return x + y
 
@@ -10,11 +24,127 @@ def multiply(x, y):
     return x * y
 
 def divide(x, y):
+    # NaN instead of an error string, so a zero divisor never mixes text into numeric results
     if y == 0:
-        return "Error! Division by zero is not possible"
+        return math.nan
     else:
         return x / y
 
+def floor_divide(x, y):
+    return math.nan if y == 0 else x // y
+
+def modulo(x, y):
+    return math.nan if y == 0 else x % y
+
+# Integer powers grow without bound ("9 ** 9 ** 9" would run for hours), so an int ** int
+# whose result would need more than MAX_POWER_BITS bits raises OverflowError, like float
+# powers already do when they overflow.
+MAX_POWER_BITS = 10_000
+
+def power(x, y):
+    if isinstance(x, int) and isinstance(y, int) and abs(x) > 1 and y * abs(x).bit_length() > MAX_POWER_BITS:
+        raise OverflowError(f"power result too large (more than {MAX_POWER_BITS} bits)")
+    return x ** y
+
+# Expressions: "price * qty - discount / 2" is parsed ONCE into an AST, checked so that only
+# numbers, variable names and + - * / // % ** are allowed, and compiled to a code object.
+# compile_expression() keeps the last 256 compiled formulas in an LRU cache, so evaluating the
+# same formula with many different variable values never parses it again.
+# / // % and ** go through divide(), floor_divide(), modulo() and power(), so a zero divisor
+# gives NaN like the rest of the calculator and integer powers stay a bounded size.
+_ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load,
+                  ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+                  ast.UAdd, ast.USub)
+
+_CALLED_OPERATORS = {ast.Div: "_divide", ast.FloorDiv: "_floor_divide", ast.Mod: "_modulo", ast.Pow: "_power"}
+
+class _OperatorsToCalls(ast.NodeTransformer):
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        name = _CALLED_OPERATORS.get(type(node.op))
+        if name is not None:
+            return ast.copy_location(
+                ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[node.left, node.right], keywords=[]),
+                node)
+        return node
+
+def _parse(text):
+    tree = ast.parse(text, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax in expression: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+            raise ValueError(f"only numbers are allowed, got {node.value!r}")
+        if isinstance(node, ast.Name) and node.id.startswith("_"):
+            raise ValueError(f"invalid variable name: {node.id}")
+    return tree
+
+class CompiledExpression:
+    def __init__(self, text):
+        tree = _parse(text)
+        self.text = text
+        self.variables = frozenset(node.id for node in ast.walk(tree) if isinstance(node, ast.Name))
+        tree = ast.fix_missing_locations(_OperatorsToCalls().visit(tree))
+        self.code = compile(tree, "<expression>", "eval")
+
+    def evaluate(self, **values):
+        missing = self.variables - values.keys()
+        if missing:
+            raise NameError(f"missing value for: {', '.join(sorted(missing))}")
+        namespace = {"__builtins__": {}, "_divide": divide, "_floor_divide": floor_divide,
+                     "_modulo": modulo, "_power": power}
+        namespace.update(values)
+        return eval(self.code, namespace)
+
+    __call__ = evaluate
+
+@lru_cache(maxsize=256)
+def compile_expression(text):
+    return CompiledExpression(text)
+
+def evaluate_expression(text, **values):
+    return compile_expression(text).evaluate(**values)
+
+# Reference version for the benchmark: parses the text and walks the tree on EVERY call.
+_BINARY = {ast.Add: add, ast.Sub: subtract, ast.Mult: multiply, ast.Div: divide,
+           ast.FloorDiv: floor_divide, ast.Mod: modulo, ast.Pow: power}
+
+def evaluate_uncached(text, **values):
+    def walk(node):
+        if isinstance(node, ast.BinOp):
+            return _BINARY[type(node.op)](walk(node.left), walk(node.right))
+        if isinstance(node, ast.UnaryOp):
+            return -walk(node.operand) if isinstance(node.op, ast.USub) else walk(node.operand)
+        if isinstance(node, ast.Name):
+            return values[node.id]
+        return node.value
+    return walk(_parse(text).body)
+
+# Benchmark: n evaluations of a few repeated formulas with changing variable values.
+#   Run with:  python 2a-exp.py --bench [n]
+def benchmark(n=1_000_000):
+    import time
+
+    formulas = ["price * qty - discount / 2", "(a + b) * (a - b) / c", "x ** 2 + 3 * x + 7"]
+    bindings = [dict(price=9.5, qty=3, discount=1.0), dict(a=4.0, b=1.5, c=2.0), dict(x=1.25)]
+    for label, func in (("parse + walk every time", evaluate_uncached),
+                        ("compiled + LRU cache", evaluate_expression)):
+        start = time.perf_counter()
+        for i in range(n):
+            k = i % 3
+            values = bindings[k]
+            values[next(iter(values))] = i        # a new value each time
+            func(formulas[k], **values)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<26} {elapsed:8.2f} s {n / elapsed:14,.0f} evaluations/sec")
+
+MENU_OPERATIONS = {
+    '1': ("+", add),
+    '2': ("-", subtract),
+    '3': ("*", multiply),
+    '4': ("/", divide),
+}
+
 def menu():
     while True:
         print("\n1. Addition")
@@ -22,14 +152,23 @@ def menu():
         print("3. Multiplication")
         print("4. Division")
         print("5. Exit")
+        print("6. Evaluate an expression")
         
-        choice = input("Enter choice (1/2/3/4/5): ")
+        choice = input("Enter choice (1/2/3/4/5/6): ")
 
         if choice == '5':
             print("Exiting the program. Thank You!!")
             break
 
-        if choice in ('1', '2', '3', '4'):
+        if choice == '6':
+            text = input("Enter expression (e.g. 2 * (3 + 4) / 5): ")
+            try:
+                print(f"Result: {text} = {evaluate_expression(text)}")
+            except (SyntaxError, ValueError, NameError, ArithmeticError) as error:
+                print(f"Invalid expression! {error}")
+            continue
+
+        if choice in MENU_OPERATIONS:
             try:
                 num1 = float(input("Enter first number: "))
                 num2 = float(input("Enter second number: "))
@@ -37,16 +176,135 @@ def menu():
                 print("Invalid Input! Please enter a numeric value.")
                 continue
 
-            if choice == '1':
-                print(f"Result: {num1} + {num2} = {add(num1, num2)}")
-            elif choice == '2':
-                print(f"Result: {num1} - {num2} = {subtract(num1, num2)}")
-            elif choice == '3':
-                print(f"Result: {num1} * {num2} = {multiply(num1, num2)}")
-            elif choice == '4':
-                print(f"Result: {num1} / {num2} = {divide(num1, num2)}")
+            symbol, operation = MENU_OPERATIONS[choice]
+            if operation is divide and num2 == 0:
+                print("Error! Division by zero is not possible")
+            else:
+                print(f"Result: {num1} {symbol} {num2} = {operation(num1, num2)}")
         else:
             print("Invalid Choice! Please select a valid option.")
 
+# Batch mode: apply one operation to every (x, y) row of a file, without any prompts.
+#   python 2a-exp.py --batch divide input.csv output.csv
+#   python 2a-exp.py --batch add input.f64 output.f64
+# Input is read and results are written one chunk of rows at a time, so files of any size work.
+#   .csv  -> two numeric columns per line (a non-numeric first line is treated as a header,
+#            blank lines are skipped)
+#   other -> raw little-endian float64 pairs x0 y0 x1 y1 ... ; output is raw float64 results
+# Division by zero gives NaN in the output (never a string). With NumPy installed each chunk is
+# computed with one vectorized operation; otherwise a pure-Python loop is used.
+OPERATIONS = {
+    "add": add, "+": add,
+    "subtract": subtract, "-": subtract,
+    "multiply": multiply, "*": multiply,
+    "divide": divide, "/": divide,
+}
+CHUNK_ROWS = 1 << 20
+
+def _numpy_divide(x, y):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = x / y
+    result[y == 0] = np.nan
+    return result
+
+def _apply(func, x, y):
+    if np is not None:
+        if func is divide:
+            return _numpy_divide(x, y)
+        return {add: np.add, subtract: np.subtract, multiply: np.multiply}[func](x, y)
+    return array("d", map(func, x, y))
+
+def _csv_pairs(path, rows):
+    # (x, y) of every data row; blank lines are skipped, and the first non-blank line may be
+    # a header. Any other row that is not two numbers is reported with its line number.
+    header_allowed = True
+    for row in rows:
+        if not any(field.strip() for field in row):
+            continue
+        try:
+            pair = float(row[0]), float(row[1])
+        except (IndexError, ValueError):
+            if header_allowed:
+                header_allowed = False
+                continue
+            raise ValueError(f"{path}, line {rows.line_num}: expected two numbers, got {','.join(row)!r}") from None
+        header_allowed = False
+        yield pair
+
+def _read_csv_chunks(path, chunk_rows):
+    with open(path, newline="") as f:
+        pairs = _csv_pairs(path, csv.reader(f))
+        while True:
+            chunk = list(islice(pairs, chunk_rows))
+            if not chunk:
+                return
+            if np is not None:
+                pairs_array = np.array(chunk, dtype=np.float64)
+                yield pairs_array[:, 0], pairs_array[:, 1]
+            else:
+                yield [a for a, _ in chunk], [b for _, b in chunk]
+
+def _read_binary_chunks(path, chunk_rows):
+    pair = struct.Struct("<dd")
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size % pair.size:
+            raise ValueError(f"{path}: {size} bytes is not a whole number of (x, y) float64 pairs, "
+                             f"the incomplete pair starts at byte {size - size % pair.size}")
+        while True:
+            if np is not None:
+                data = np.fromfile(f, dtype="<f8", count=2 * chunk_rows)
+                if data.size == 0:
+                    return
+                pairs = data.reshape(-1, 2)
+                yield pairs[:, 0], pairs[:, 1]
+            else:
+                block = f.read(pair.size * chunk_rows)
+                if not block:
+                    return
+                xs = array("d")
+                xs.frombytes(block)
+                if sys.byteorder == "big":
+                    xs.byteswap()
+                yield xs[0::2], xs[1::2]
+
+def run_batch(operation, input_path, output_path, chunk_rows=CHUNK_ROWS):
+    # returns (rows processed, rows that were division by zero)
+    if operation not in OPERATIONS:
+        raise ValueError(f"unknown operation {operation!r}, expected one of {', '.join(OPERATIONS)}")
+    func = OPERATIONS[operation]
+    is_csv = input_path.endswith(".csv")
+    chunks = _read_csv_chunks(input_path, chunk_rows) if is_csv else _read_binary_chunks(input_path, chunk_rows)
+    total = 0
+    nan_count = 0
+    with open(output_path, "w" if output_path.endswith(".csv") else "wb") as out:
+        for x, y in chunks:
+            result = _apply(func, x, y)
+            total += len(result)
+            if func is divide:
+                nan_count += int(np.count_nonzero(np.asarray(y) == 0)) if np is not None \
+                    else sum(1 for v in y if v == 0)
+            if output_path.endswith(".csv"):
+                out.write("".join(f"{v!r}\n" for v in result.tolist()))
+            elif np is not None:
+                result.astype("<f8").tofile(out)
+            else:
+                if sys.byteorder == "big":
+                    result.byteswap()
+                result.tofile(out)
+    return total, nan_count
+
 if __name__ == "__main__":
-    menu()
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
+    elif "--batch" in sys.argv:
+        position = sys.argv.index("--batch")
+        operation, input_path, output_path = sys.argv[position + 1:position + 4]
+        try:
+            rows, zero_divisions = run_batch(operation, input_path, output_path)
+        except ValueError as error:
+            sys.exit(f"Invalid input! {error}")
+        print(f"Processed {rows} rows ({zero_divisions} divisions by zero written as NaN).")
+    else:
+        menu()
@@ -1,16 +1,324 @@
 #b) Write a program to check if the string is a palindrome or not
+import os
+
+# Two pointers walk in from both ends, so no cleaned copy and no reversed copy of the whole
+# input is ever built. To keep the per-character work in C, the pointers move one BLOCK at a
+# time: the front block is normalized, the back block is normalized and reversed, and the two
+# are compared with one string comparison. Memory use is O(block_size) for any input size.
+#   normalize=True  -> characters that are not letters/digits (spaces, punctuation) are skipped
+#                      and letters are compared case-insensitively (casefold() handles non-ASCII)
+#   bytes / bytearray / memoryview inputs are compared byte by byte with ASCII rules
+BLOCK_SIZE = 1 << 16
+_ASCII_ALNUM = b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_BYTES_LOWER = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
+_BYTES_SKIP = bytes(b for b in range(256) if b not in _ASCII_ALNUM)
+
+def _normalize_bytes(block):
+    return bytes(block).translate(_BYTES_LOWER, _BYTES_SKIP)
+
+def _normalize_str(block):
+    if block.isascii():
+        return block.encode("ascii").translate(_BYTES_LOWER, _BYTES_SKIP).decode("ascii")
+    return "".join(filter(str.isalnum, block)).casefold()
+
+def _two_pointer_blocks(length, read_front, read_back, normalize, block_size):
+    # read_front(i, limit) -> (raw block starting at i, new i)
+    # read_back(j, limit)  -> (raw block ending at j, new j)
+    # F = everything taken from the front, B = everything taken from the back (reversed).
+    # Matching F against B covers the two outer parts; whatever is left over once the
+    # pointers meet is the middle of the text and must be a palindrome on its own.
+    i, j = 0, length
+    front = back = None
+    while True:
+        while not front and i < j:
+            block, i = read_front(i, min(block_size, j - i))
+            front = normalize(block) if normalize else block
+        while not back and i < j:
+            block, j = read_back(j, min(block_size, j - i))
+            back = (normalize(block) if normalize else block)[::-1]
+        if not front or not back:
+            break
+        n = min(len(front), len(back))
+        if front[:n] != back[:n]:
+            return False
+        front = front[n:]
+        back = back[n:]
+    rest = front or back or ""
+    return rest == rest[::-1]
+
+def is_palindrome(text, normalize=True, block_size=BLOCK_SIZE):
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        data = memoryview(text).cast("B")     # no copy; each block is copied only when normalized
+        norm = _normalize_bytes if normalize else None
+        return _two_pointer_blocks(len(data),
+                                   lambda i, n: (bytes(data[i:i + n]), i + n),
+                                   lambda j, n: (bytes(data[j - n:j]), j - n),
+                                   norm, block_size)
+    return _two_pointer_blocks(len(text),
+                               lambda i, n: (text[i:i + n], i + n),
+                               lambda j, n: (text[j - n:j], j - n),
+                               _normalize_str if normalize else None, block_size)
+
+# Checking a file that does not fit in memory: the same two pointers, but each block is read
+# with seek() + read(). For UTF-8 files block edges are moved so that no character is split
+# between the front and the back reader. With encoding=None the file is compared as bytes.
+# Invalid UTF-8 raises UnicodeDecodeError: a block that is left empty after the edge fix-up
+# can only come from bytes that are not UTF-8 (a block of >= 4 bytes always holds a character).
+def _utf8_char_length(lead):
+    if lead < 0x80:
+        return 1
+    if lead >= 0xF0:
+        return 4
+    if lead >= 0xE0:
+        return 3
+    return 2
+
+def is_palindrome_file(path, block_size=BLOCK_SIZE, encoding="utf-8", normalize=True):
+    if encoding not in (None, "utf-8"):
+        raise ValueError("only UTF-8 text or raw bytes (encoding=None) are supported")
+    if encoding and block_size < 4:
+        raise ValueError("block_size must hold at least one UTF-8 character (4 bytes)")
+
+    with open(path, "rb") as f:
+        length = f.seek(0, os.SEEK_END)
+
+        def read_front(i, n):
+            f.seek(i)
+            block = f.read(n)
+            if encoding:
+                # drop an incomplete character at the end; the next front read starts with it
+                t = len(block)
+                while t > 0 and block[t - 1] & 0xC0 == 0x80:
+                    t -= 1
+                if t > 0 and t - 1 + _utf8_char_length(block[t - 1]) > len(block):
+                    if t == 1:
+                        raise UnicodeDecodeError(encoding, block, 0, len(block), f"truncated character at byte {i}")
+                    block = block[:t - 1]
+                return block.decode(encoding), i + len(block)
+            return block, i + n
+
+        def read_back(j, n):
+            f.seek(j - n)
+            block = f.read(n)
+            if encoding:
+                # drop continuation bytes at the start; the next back read ends with them
+                cut = 0
+                while cut < len(block) and block[cut] & 0xC0 == 0x80:
+                    cut += 1
+                if cut == len(block):
+                    raise UnicodeDecodeError(encoding, block, 0, len(block),
+                                             f"no character start in bytes {j - n}..{j}")
+                block = block[cut:]
+                return block.decode(encoding), j - len(block)
+            return block, j - n
+
+        norm = (_normalize_str if encoding else _normalize_bytes) if normalize else None
+        return _two_pointer_blocks(length, read_front, read_back, norm, block_size)
+
+# Manacher's algorithm: longest palindromic substring in O(n).
+# d1[i] = number of odd-length palindromes centred at i, d2[i] = even-length ones centred
+# between i-1 and i. Inside the rightmost palindrome found so far [l, r), the answer for i
+# starts from its mirror position, so each character is expanded over at most once.
+def longest_palindromic_substring(s):
+    n = len(s)
+    if n == 0:
+        return s[:0]
+    best_start, best_len = 0, 1
+    d1 = [0] * n
+    l, r = 0, -1
+    for i in range(n):
+        k = 1 if i > r else min(d1[l + r - i], r - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        d1[i] = k
+        if 2 * k - 1 > best_len:
+            best_start, best_len = i - k + 1, 2 * k - 1
+        if i + k - 1 > r:
+            l, r = i - k + 1, i + k - 1
+    d2 = [0] * n
+    l, r = 0, -1
+    for i in range(n):
+        k = 0 if i > r else min(d2[l + r - i + 1], r - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        d2[i] = k
+        if 2 * k > best_len:
+            best_start, best_len = i - k, 2 * k
+        if i + k - 1 > r:
+            l, r = i - k, i + k - 1
+    return s[best_start:best_start + best_len]
+
+# Benchmark: MB/s on a large palindrome (the worst case: every character must be compared).
+#   Run with:  python 2b-exp.py --bench [size_in_MB]
+def benchmark(size_mb=100):
+    import random
+    import time
+
+    half = "".join(random.choices("abc de,F", k=size_mb << 19))
+    text = half + half[::-1]
+    data = text.encode()
+    path = "palindrome_bench.txt"
+    with open(path, "wb") as f:
+        f.write(data)
+
+    def report(label, func, mb):
+        start = time.perf_counter()
+        assert func()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<42} {mb / elapsed:10.1f} MB/s")
+
+    try:
+        print(f"Palindrome checks on {len(data) / (1 << 20):.0f} MB")
+        def original():
+            cleaned_string = text.replace(" ", "").lower()
+            return cleaned_string == cleaned_string[::-1]
+
+        report("original (clean + reverse)", original, size_mb)
+        report("is_palindrome(str)", lambda: is_palindrome(text), size_mb)
+        report("is_palindrome(bytes)", lambda: is_palindrome(data), size_mb)
+        report("is_palindrome(memoryview)", lambda: is_palindrome(memoryview(data)), size_mb)
+        report("is_palindrome_file", lambda: is_palindrome_file(path), size_mb)
+        small = text[:min(len(text), 10 << 20)]
+        report(f"longest_palindromic_substring ({len(small) >> 20} MB)",
+               lambda: longest_palindromic_substring(small) is not None, len(small) / (1 << 20))
+    finally:
+        os.remove(path)
+
+# Bulk mode: classify every line of a (huge) word list and write the palindromic lines.
+#   python 2b-exp.py --classify words.txt palindromes.txt [--workers N]
+# The file is cut into ~4 MB chunks that end on a line boundary. Chunks are sent to a
+# ProcessPoolExecutor (one process per core, so the GIL is not shared) and results are
+# written back in input order. Only a few chunks per worker are in flight at a time, so
+# memory stays bounded however long the file is. Empty lines are never matches.
+CLASSIFY_CHUNK = 4 << 20
+
+def _palindrome_lines(chunk):
+    # runs in a worker process: returns (lines seen, matching lines joined as bytes)
+    lines = chunk.split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    matches = []
+    for line in lines:
+        line = line.rstrip(b"\r")
+        if line.isascii():
+            key = line.translate(_BYTES_LOWER, _BYTES_SKIP)
+        else:
+            key = _normalize_str(line.decode("utf-8", "replace"))
+        if key and key == key[::-1]:
+            matches.append(line + b"\n")
+    return len(lines), b"".join(matches)
+
+def _line_chunks(path, chunk_size):
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            if not chunk.endswith(b"\n"):
+                chunk += f.readline()      # finish the last line
+            yield chunk
+
+def classify_file(input_path, output_path, workers=None, chunk_size=CLASSIFY_CHUNK):
+    # returns (lines read, palindromic lines written)
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    total = found = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool, open(output_path, "wb") as out:
+        pending = deque()
+
+        def write_oldest():
+            nonlocal total, found
+            count, matches = pending.popleft().result()
+            total += count
+            found += matches.count(b"\n")
+            out.write(matches)
+
+        for chunk in _line_chunks(input_path, chunk_size):
+            pending.append(pool.submit(_palindrome_lines, chunk))
+            if len(pending) >= 2 * workers:
+                write_oldest()
+        while pending:
+            write_oldest()
+    return total, found
+
+# Scaling benchmark: lines/sec for 1..N worker processes on a synthetic word list.
+#   Run with:  python 2b-exp.py --classify-bench [lines]
+def benchmark_classify(lines=5_000_000, max_workers=None):
+    import random
+    import time
+
+    path, out_path = "classify_bench.txt", "classify_bench_out.txt"
+    words = ["level", "Racecar", "python", "Never odd or even", "ferrari", "noon", "kayak", "bugatti"]
+    with open(path, "w") as f:
+        for _ in range(lines // 1000):
+            f.write("\n".join(random.choices(words, k=1000)) + "\n")
+    max_workers = max_workers or os.cpu_count() or 1
+    try:
+        base = None
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            total, found = classify_file(path, out_path, workers)
+            rate = total / (time.perf_counter() - start)
+            base = base or rate
+            print(f"{workers:>2} workers {rate:14,.0f} lines/sec  speedup {rate / base:5.2f}x  ({found:,} matches)")
+    finally:
+        os.remove(path)
+        os.remove(out_path)
+
+def run_tests():
+    import tempfile
+
+    assert is_palindrome("Never odd or even") and not is_palindrome("ferrari")
+    assert is_palindrome(b"No lemon, no melon") and is_palindrome("Ésope reste ici et se reposÉ")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "text.txt")
+        cases = [("été, été", 4, True), ("abcdéédcba", 4, True), ("abcdé", 4, False)]
+        for text, block_size, expected in cases:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            assert is_palindrome_file(path, block_size) == expected, text
+        # malformed UTF-8 must raise, never spin on a block that cannot advance
+        for data, block_size in ((b"abcd" + b"\x80" * 8, 4), (b"x" * 70000 + b"\x80" * 70000, BLOCK_SIZE),
+                                 (b"\xf0" + b"a" * 8, 4), (b"ab\xf0", 4)):
+            with open(path, "wb") as f:
+                f.write(data)
+            try:
+                is_palindrome_file(path, block_size)
+            except UnicodeDecodeError:
+                pass
+            else:
+                raise AssertionError(f"no error for {data[:8]!r}...")
+            assert is_palindrome_file(path, block_size, encoding=None) in (True, False)
+    print("All tests passed.")
 
 def check_palindrome():
     original_input = input("Enter a word or phrase: ")
-    
 
-    cleaned_string = original_input.replace(" ", "").lower()
-    
-   
-    if cleaned_string == cleaned_string[::-1]:
+    if is_palindrome(original_input):
         print(f"Yes! '{original_input}' is palindrome.")
     else:
         print(f"No. '{original_input}' is not a palindrome.")
 
-
-check_palindrome()
+if __name__ == "__main__":
+    import sys
+    if "--test" in sys.argv:
+        run_tests()
+    elif "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 100)
+    elif "--classify-bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--classify-bench"]
+        benchmark_classify(int(args[0]) if args else 5_000_000)
+    elif "--classify" in sys.argv:
+        import time
+        position = sys.argv.index("--classify")
+        input_path, output_path = sys.argv[position + 1:position + 3]
+        workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
+        start = time.perf_counter()
+        total, found = classify_file(input_path, output_path, workers)
+        elapsed = time.perf_counter() - start
+        print(f"{total:,} lines, {found:,} palindromes, {total / elapsed:,.0f} lines/sec")
+    else:
+        check_palindrome()
@@ -1,13 +1,175 @@
 #2c)Write a program to find the factorial of a given number.
-def factorial(n):
+from collections import OrderedDict
+
+
+def factorial_recursive(n):
+    # the original version: one stack frame per number, so it fails past ~1000
     if n == 1 or n == 0:
         return 1
     else:
-        return n * factorial(n - 1)
+        return n * factorial_recursive(n - 1)
+
+# Multiplying 1 * 2 * 3 * ... left to right makes one number grow huge while the other stays
+# tiny, which is slow for big integers. A product TREE multiplies numbers of similar size:
+#   [1, 2, 3, 4, 5, 6, 7, 8] -> [2, 12, 30, 56] -> [24, 1680] -> [40320]
+# It is built level by level with a loop, so there is no recursion limit.
+def product_tree(values):
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+def range_product(lo, hi):
+    # product of lo+1, lo+2, ..., hi
+    return product_tree(range(lo + 1, hi + 1))
 
-num = int(input("Enter a number: "))
+# Prime swing (Luschny): n! = (n//2)!^2 * swing(n), where swing(n) = n! / (n//2)!^2 is a
+# product of primes <= n. Prime p appears in swing(n) with exponent
+#   sum over k >= 1 of ((n // p^k) % 2)
+# so swing(n) is much smaller than n! and is built from few, large factors.
+def _primes_up_to(n):
+    flags = bytearray([1]) * (n + 1)
+    flags[0:2] = b"\x00\x00"[:n + 1]
+    for i in range(2, int(n ** 0.5) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes(len(range(i * i, n + 1, i)))
+    return [i for i, flag in enumerate(flags) if flag]
 
-if num < 0:
-    print("Factorial does not exist for negative numbers.")
-else:
-    print(f"The factorial of {num} is {factorial(num)}")
\ No newline at end of file
+def _swing(n, primes):
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        power = 1
+        q = n
+        while q:
+            q //= p
+            if q & 1:
+                power *= p
+        if power > 1:
+            factors.append(power)
+    return product_tree(factors)
+
+def factorial_prime_swing(n):
+    primes = _primes_up_to(n)
+    # n, n//2, n//4, ... down to 1, then build the factorials back up without recursion
+    chain = []
+    while n > 1:
+        chain.append(n)
+        n //= 2
+    result = 1
+    for m in reversed(chain):
+        result = result * result * _swing(m, primes)
+    return result
+
+# Memo table of checkpoints: up to CHECKPOINT_LIMIT recent results are kept. A request for a
+# nearby n starts from the closest smaller checkpoint k and only multiplies (k, n].
+CHECKPOINT_LIMIT = 32
+PRIME_SWING_THRESHOLD = 20_000
+_checkpoints = OrderedDict()
+_SMALL = [1]
+for _i in range(1, 21):
+    _SMALL.append(_SMALL[-1] * _i)
+
+def factorial(n):
+    if n < 0:
+        raise ValueError("Factorial does not exist for negative numbers.")
+    if n < len(_SMALL):
+        return _SMALL[n]
+    if n in _checkpoints:
+        _checkpoints.move_to_end(n)
+        return _checkpoints[n]
+    base = max((k for k in _checkpoints if k < n), default=None)
+    if base is not None and n - base <= base // 4:
+        result = _checkpoints[base] * range_product(base, n)
+    elif n >= PRIME_SWING_THRESHOLD:
+        result = factorial_prime_swing(n)
+    else:
+        result = range_product(1, n)
+    _checkpoints[n] = result
+    if len(_checkpoints) > CHECKPOINT_LIMIT:
+        _checkpoints.popitem(last=False)
+    return result
+
+def _is_prime(m):
+    if m < 2:
+        return False
+    i = 2
+    while i * i <= m:
+        if m % i == 0:
+            return False
+        i += 1
+    return True
+
+def factorial_mod(n, m):
+    # n! % m without building the huge number
+    if n < 0:
+        raise ValueError("Factorial does not exist for negative numbers.")
+    if m < 1:
+        raise ValueError("The modulus must be a positive integer.")
+    if m == 1 or n >= m:
+        return 0          # m itself is one of the factors 1..n
+    if n > m // 2 and _is_prime(m):
+        # Wilson's theorem: (m-1)! = -1 (mod m), so n! = -1 / ((n+1)...(m-1)) (mod m)
+        rest = 1
+        for k in range(n + 1, m):
+            rest = rest * k % m
+        return -pow(rest, -1, m) % m
+    result = 1
+    for k in range(2, n + 1):
+        result = result * k % m
+    return result
+
+# Benchmark: recursive vs product tree vs prime swing vs math.factorial.
+#   Run with:  python 2c-exp.py --bench [max_n]
+def benchmark(max_n=1_000_000):
+    import math
+    import time
+
+    def timed(func, n):
+        start = time.perf_counter()
+        try:
+            value = func(n)
+        except RecursionError:
+            return "RecursionError", None
+        return f"{time.perf_counter() - start:9.3f} s", value
+
+    print(f"{'n':>9} {'recursive':>15} {'product tree':>12} {'prime swing':>12} {'math':>12}")
+    n = 1_000
+    while n <= max_n:
+        expected_time, expected = timed(math.factorial, n)
+        row = []
+        for func in (factorial_recursive, lambda k: range_product(1, k), factorial_prime_swing):
+            label, value = timed(func, n)
+            assert value is None or value == expected
+            row.append(label)
+        print(f"{n:>9} {row[0]:>15} {row[1]:>12} {row[2]:>12} {expected_time:>12}")
+        n *= 10
+
+    _checkpoints.clear()
+    factorial(100_000)
+    start = time.perf_counter()
+    factorial(100_500)
+    print(f"factorial(100_500) after factorial(100_000) (checkpoint reuse): {time.perf_counter() - start:.4f} s")
+    start = time.perf_counter()
+    factorial_mod(10**6, 10**9 + 7)
+    print(f"factorial_mod(10**6, 10**9 + 7): {time.perf_counter() - start:.4f} s")
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
+        sys.exit()
+
+    num = int(input("Enter a number: "))
+
+    if num < 0:
+        print("Factorial does not exist for negative numbers.")
+    else:
+        print(f"The factorial of {num} is {factorial(num)}")
@@ -1,23 +1,129 @@
 #3a)Write a program to read a number and display the corresponding day of the week using if-elif.
+from datetime import date, datetime, timezone
+
 try:
-    day_num = int(input("Enter a number (1-7) for the day of the week: "))
-
-    if day_num == 1:
-        print("Day 1 is Sunday")
-    elif day_num == 2:
-        print("Day 2 is Monday")
-    elif day_num == 3:
-        print("Day 3 is Tuesday")
-    elif day_num == 4:
-        print("Day 4 is Wednesday")
-    elif day_num == 5:
-        print("Day 5 is Thursday")
-    elif day_num == 6:
-        print("Day 6 is Friday")
-    elif day_num == 7:
-        print("Day 7 is Saturday")
-    else:
-        print("Invalid Input! Please enter a number between 1 to 7.")
-
-except ValueError:
-    print("Invalid Input! Please enter a numeric value.")
+    import numpy as np
+except ImportError:
+    np = None
+
+# Day numbers follow this experiment: 1 = Sunday ... 7 = Saturday.
+# A tuple lookup replaces the 7-branch if/elif chain: one index operation per number.
+DAY_NAMES = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+_NAME_BY_NUM = dict(enumerate(DAY_NAMES, start=1))
+
+def weekday_name(day_num):
+    if day_num not in _NAME_BY_NUM:
+        raise ValueError("Invalid Input! Please enter a number between 1 to 7.")
+    return _NAME_BY_NUM[day_num]
+
+def weekday_names(day_nums):
+    # bulk version: a NumPy fancy-index when available, else map() over a number -> name dict.
+    # Both accept only whole numbers: 1.5 is rejected, not truncated to 1 by the int cast.
+    if np is not None:
+        raw = np.asarray(day_nums)
+        if raw.dtype.kind not in "biuf":
+            raise ValueError("Invalid Input! Day numbers must be whole numbers.")
+        if raw.dtype.kind == "f" and not (np.isfinite(raw) & (raw == np.floor(raw))).all():
+            raise ValueError("Invalid Input! Day numbers must be whole numbers.")
+        nums = raw.astype(np.int64)
+        if nums.size and (nums.min() < 1 or nums.max() > 7):
+            raise ValueError("Invalid Input! Day numbers must be between 1 to 7.")
+        return np.array(DAY_NAMES)[nums - 1]
+    try:
+        return list(map(_NAME_BY_NUM.__getitem__, day_nums))   # the loop runs in C
+    except KeyError:
+        raise ValueError("Invalid Input! Day numbers must be between 1 to 7.") from None
+
+# Dates -> day numbers (1 = Sunday) without calling a calendar function per row.
+# 1970-01-01 was a Thursday (day 5), so for a count of whole days since 1970-01-01:
+#   day_num = (days + 4) % 7 + 1
+# NumPy's datetime64 stores dates exactly as such day counts, so a whole array of dates or
+# epoch timestamps converts with one cast and one modulo.
+# Timezone-aware datetimes (and ISO strings with an offset) are counted by their UTC day on
+# both paths: NumPy converts them to UTC itself, while date() would keep the local day.
+def _as_utc(d):
+    if isinstance(d, str) and len(d) > 10:
+        try:
+            parsed = datetime.fromisoformat(d)
+        except ValueError:
+            return d
+        if parsed.utcoffset() is None:
+            return d
+        d = parsed
+    if isinstance(d, datetime) and d.utcoffset() is not None:
+        return d.astimezone(timezone.utc).replace(tzinfo=None)
+    return d
+
+def dates_to_weekday(dates):
+    # dates: ISO strings ("2024-05-17"), datetime.date/datetime objects or datetime64 values
+    if np is not None:
+        if not isinstance(dates, np.ndarray):
+            dates = [_as_utc(d) for d in dates]
+        days = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+        return (days + 4) % 7 + 1
+    result = []
+    for d in map(_as_utc, dates):
+        if isinstance(d, str):
+            d = date.fromisoformat(d[:10])
+        elif isinstance(d, datetime):
+            d = d.date()
+        result.append(d.toordinal() % 7 + 1)   # ordinal 7 (0001-01-07) was a Sunday
+    return result
+
+def epochs_to_weekday(timestamps, unit="s"):
+    # timestamps since 1970-01-01 UTC in seconds ("s"), milliseconds ("ms") or nanoseconds ("ns")
+    per_day = {"s": 86_400, "ms": 86_400_000, "ns": 86_400_000_000_000}[unit]
+    if np is not None:
+        days = np.floor_divide(np.asarray(timestamps, dtype=np.int64), per_day)
+        return (days + 4) % 7 + 1
+    return [(int(ts) // per_day + 4) % 7 + 1 for ts in timestamps]
+
+# Benchmark: labelling many rows with the if/elif chain vs table lookups.
+#   Run with:  python 3a-exp.py --bench [rows]
+def benchmark(rows=5_000_000):
+    import random
+    import time
+
+    def if_elif(day_num):
+        if day_num == 1:
+            return "Sunday"
+        elif day_num == 2:
+            return "Monday"
+        elif day_num == 3:
+            return "Tuesday"
+        elif day_num == 4:
+            return "Wednesday"
+        elif day_num == 5:
+            return "Thursday"
+        elif day_num == 6:
+            return "Friday"
+        else:
+            return "Saturday"
+
+    nums = [random.randint(1, 7) for _ in range(rows)]
+    stamps = [random.randrange(0, 2_000_000_000) for _ in range(rows)]
+    for label, func in (("if/elif chain", lambda: [if_elif(n) for n in nums]),
+                        ("weekday_names", lambda: weekday_names(nums)),
+                        ("epochs_to_weekday", lambda: epochs_to_weekday(stamps))):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<20} {rows / elapsed:14,.0f} rows/sec")
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 5_000_000)
+        sys.exit()
+
+    try:
+        day_num = int(input("Enter a number (1-7) for the day of the week: "))
+
+        if 1 <= day_num <= 7:
+            print(f"Day {day_num} is {weekday_name(day_num)}")
+        else:
+            print("Invalid Input! Please enter a number between 1 to 7.")
+
+    except ValueError:
+        print("Invalid Input! Please enter a numeric value.")
@@ -1,20 +1,97 @@
-#3c) Write a program to prompt for a score between 0.0 and 1.0. If the score is out of range, print an error. 
+#3c) Write a program to prompt for a score between 0.0 and 1.0. If the score is out of range, print an error.
 #    If the score is between 0.0 and 1.0, print a grade
+from bisect import bisect_right
+from functools import partial
 
-score_input = input("Enter Score (between 0.0 and 1.0): ")
 try:
-    score = float(score_input)
-    if score < 0.0 or score > 1.0:
-        print("Error, score is out of range. Please enter a value between 0.0 and 1.0.")
-    elif score >= 0.9:
-        print("A")
-    elif score >= 0.8:
-        print("B")
-    elif score >= 0.7:
-        print("C")
-    elif score >= 0.6:
-        print("D")
+    import numpy as np
+except ImportError:
+    np = None
+
+# The grade ladder as a table instead of an if/elif chain:
+#   score <  0.6 -> F,  0.6 <= score < 0.7 -> D,  ...,  score >= 0.9 -> A
+# GRADES has one more entry than THRESHOLDS. bisect_right() counts how many thresholds are
+# <= score, which is exactly the position of the grade: O(log k) for k thresholds.
+THRESHOLDS = (0.6, 0.7, 0.8, 0.9)
+GRADES = ("F", "D", "C", "B", "A")
+SCORE_RANGE = (0.0, 1.0)
+
+def grade(score, thresholds=THRESHOLDS, grades=GRADES, score_range=SCORE_RANGE):
+    lo, hi = score_range
+    if not lo <= score <= hi:
+        raise ValueError(f"score {score} is out of range {lo} to {hi}")
+    return grades[bisect_right(thresholds, score)]
+
+def grade_many(scores, thresholds=THRESHOLDS, grades=GRADES, score_range=SCORE_RANGE):
+    # returns (grades, out_of_range): out_of_range[i] is True for scores outside score_range
+    # (including NaN); their grade is "" instead of a printed error.
+    lo, hi = score_range
+    if np is not None:
+        scores = np.asarray(scores, dtype=np.float64)
+        out_of_range = ~((scores >= lo) & (scores <= hi))
+        letters = np.array(grades)[np.searchsorted(thresholds, scores, side="right")]
+        letters[out_of_range] = ""
+        return letters, out_of_range
+    scores = list(scores)
+    letters = list(map(grades.__getitem__, map(partial(bisect_right, thresholds), scores)))
+    out_of_range = [not lo <= score <= hi for score in scores]
+    if True in out_of_range:
+        for i, bad in enumerate(out_of_range):
+            if bad:
+                letters[i] = ""
+    return letters, out_of_range
+
+# Benchmark: grading many scores with the if/elif chain vs grade_many().
+#   Run with:  python 3c-exp.py --bench [count]
+def benchmark(count=None):
+    import random
+    import time
+
+    def if_elif(score):
+        if score < 0.0 or score > 1.0:
+            return ""
+        elif score >= 0.9:
+            return "A"
+        elif score >= 0.8:
+            return "B"
+        elif score >= 0.7:
+            return "C"
+        elif score >= 0.6:
+            return "D"
+        else:
+            return "F"
+
+    count = count or (50_000_000 if np is not None else 2_000_000)
+    if np is not None:
+        scores = np.random.default_rng().uniform(-0.05, 1.05, count)
     else:
-        print("F")
-except ValueError:
-    print("Error: Invalid Input. Please enter numeric")
+        scores = [random.uniform(-0.05, 1.05) for _ in range(count)]
+
+    sample = [float(s) for s in scores[:2_000_000]]     # the chain is too slow for all of them
+    start = time.perf_counter()
+    [if_elif(s) for s in sample]
+    elapsed = time.perf_counter() - start
+    print(f"{'if/elif chain':<16} {elapsed:8.3f} s {len(sample) / elapsed:14,.0f} scores/sec"
+          f"  ({len(sample):,} scores)")
+    start = time.perf_counter()
+    grade_many(scores)
+    elapsed = time.perf_counter() - start
+    print(f"{'grade_many':<16} {elapsed:8.3f} s {count / elapsed:14,.0f} scores/sec"
+          f"  ({'numpy' if np is not None else 'pure Python'}, {count:,} scores)")
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else None)
+        sys.exit()
+
+    score_input = input("Enter Score (between 0.0 and 1.0): ")
+    try:
+        score = float(score_input)
+        if score < 0.0 or score > 1.0:
+            print("Error, score is out of range. Please enter a value between 0.0 and 1.0.")
+        else:
+            print(grade(score))
+    except ValueError:
+        print("Error: Invalid Input. Please enter numeric")
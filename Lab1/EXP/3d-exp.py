@@ -1,22 +1,236 @@
-## Write a program to prompt the user for hours and rate per hour using input to compute gross pay. Pay the 
-## hourly rate for the hours up to 40 and 1.5 times the hourly rate for all hours worked above 40 hours. Use 45 
-## hours and a rate of 10.50 per hour to test the program (the pay should be 498.75). You should use input to 
+## Write a program to prompt the user for hours and rate per hour using input to compute gross pay. Pay the
+## hourly rate for the hours up to 40 and 1.5 times the hourly rate for all hours worked above 40 hours. Use 45
+## hours and a rate of 10.50 per hour to test the program (the pay should be 498.75). You should use input to
 ## read a string and float() to convert the string to a number.
+import csv
+from decimal import Decimal, ROUND_HALF_UP
+from fractions import Fraction
+from itertools import islice
+from math import lcm
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+# Overtime tiers: (hours after which the tier starts, pay multiplier), in increasing order.
+# The default is this experiment's rule: normal rate up to 40 hours, 1.5x after that.
+# More tiers can be added, e.g. (("0", "1"), ("40", "1.5"), ("60", "2")).
+DEFAULT_TIERS = (("0", "1"), ("40", "1.5"))
 
-hrs_input = input("Enter Hours: ")
-rate_input = input("Enter Rate per Hour: ")
+# Exact money: floats cannot store 10.50 * 1.5 etc. exactly, so pay is computed with
+# integers: hours in hundredths of an hour and rates in cents, both rounded half-up from the
+# input text. Multipliers are fractions (1.5 = 3/2) and the total is rounded half-up to a
+# whole cent only at the end, so gross_pay(), the NumPy columns and the pure-Python
+# fallback always give the same figure.
+def _tier_table(tiers):
+    starts = [Fraction(start) for start, _ in tiers]
+    multipliers = [Fraction(multiplier) for _, multiplier in tiers]
+    if starts[0] != 0 or starts != sorted(starts):
+        raise ValueError("tiers must start at 0 hours and be in increasing order")
+    return starts, multipliers
 
-hrs = float(hrs_input)
-rate = float(rate_input)
+def _integer_tiers(tiers):
+    # -> (scale, [(start, end, weight), ...]) with start/end in 1/100 h (end None = open ended)
+    # and weight = multiplier * scale, an integer for every tier
+    starts, multipliers = _tier_table(tiers)
+    scale = lcm(*(m.denominator for m in multipliers))
+    ends = [int(s * 100) for s in starts[1:]] + [None]
+    return scale, [(int(s * 100), e, int(m * scale)) for s, e, m in zip(starts, ends, multipliers)]
 
-if hrs <= 40:
-    pay = hrs * rate
-else:
-    regular_pay = 40 * rate
-    overtime_hrs = hrs - 40
-    overtime_pay = overtime_hrs * (rate * 1.5)
-    pay = regular_pay + overtime_pay
+def _to_hundredths(value):
+    # the ONE rounding rule for inputs: hours and rates are taken to 2 decimals, half-up,
+    # straight from their text (never through a float product)
+    return int((Decimal(str(value).strip()) * 100).to_integral_value(rounding=ROUND_HALF_UP))
 
-print("Gross Pay:", pay)
+def _format_cents(cents):
+    # 1050 -> "10.50", -10 -> "-0.10" (sign and digits apart, since -10 // 100 is -1)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{abs(cents) // 100}.{abs(cents) % 100:02d}"
+
+def gross_pay(hours, rate, tiers=DEFAULT_TIERS):
+    # one employee, exact to the cent, as a Decimal; same arithmetic as every other path
+    cents = gross_pay_cents(_to_hundredths(hours), _to_hundredths(rate), tiers)
+    return Decimal(cents).scaleb(-2)
+
+def _cents(hours, rate, scale, table):
+    units = 0          # pay in (cents / 100) / scale
+    for start, end, weight in table:
+        if hours <= start:
+            break
+        units += ((hours if end is None or hours < end else end) - start) * rate * weight
+    return (units + 50 * scale) // (100 * scale)     # round half-up to a whole cent
+
+def gross_pay_cents(hours_hundredths, rate_cents, tiers=DEFAULT_TIERS):
+    # integer mode: hours in 1/100 h, rate in cents -> pay in cents
+    scale, table = _integer_tiers(tiers)
+    return _cents(hours_hundredths, rate_cents, scale, table)
+
+def gross_pay_cents_many(hours_hundredths, rate_cents, tiers=DEFAULT_TIERS):
+    # vectorized integer mode: whole columns at once with np.minimum / np.maximum in int64
+    scale, table = _integer_tiers(tiers)
+    if np is None:
+        return [_cents(h, r, scale, table) for h, r in zip(hours_hundredths, rate_cents)]
+    hours = np.asarray(hours_hundredths, dtype=np.int64)
+    rates = np.asarray(rate_cents, dtype=np.int64)
+    units = np.zeros_like(hours)
+    for start, end, weight in table:
+        tier_hours = np.maximum(hours - start, 0)
+        if end is not None:
+            tier_hours = np.minimum(tier_hours, end - start)
+        units += tier_hours * rates * weight
+    return (units + 50 * scale) // (100 * scale)
+
+# Streaming payroll run over a timesheet CSV with columns: employee,hours,rate
+#   python 3d-exp.py --payroll timesheets.csv payroll.csv
+# Rows are processed one chunk of columns at a time and written as employee,gross_pay.
+PAYROLL_CHUNK = 1 << 18
+
+def _parse_hundredths_column(values):
+    return list(map(_to_hundredths, values))
+
+def _timesheet_rows(path, rows):
+    # (employee, hours in 1/100 h, rate in cents) of every data row; blank lines are skipped,
+    # and the first non-blank line may be a header. Any other row that is not
+    # employee,hours,rate is reported with its line number.
+    header_allowed = True
+    for row in rows:
+        if not any(field.strip() for field in row):
+            continue
+        try:
+            if len(row) != 3:
+                raise ValueError
+            entry = row[0], _to_hundredths(row[1]), _to_hundredths(row[2])
+        except (ArithmeticError, ValueError):     # decimal.InvalidOperation is an ArithmeticError
+            if header_allowed:
+                header_allowed = False
+                continue
+            raise ValueError(f"{path}, line {rows.line_num}: expected employee,hours,rate, "
+                             f"got {','.join(row)!r}") from None
+        header_allowed = False
+        yield entry
+
+def run_payroll(input_path, output_path, tiers=DEFAULT_TIERS, chunk_rows=PAYROLL_CHUNK):
+    # returns (rows, total pay in cents)
+    rows = 0
+    total_cents = 0
+    with open(input_path, newline="") as f, open(output_path, "w", newline="") as out:
+        entries = _timesheet_rows(input_path, csv.reader(f))
+        out.write("employee,gross_pay\n")
+        while True:
+            chunk = list(islice(entries, chunk_rows))
+            if not chunk:
+                break
+            employees, hours, rates = zip(*chunk)
+            cents = gross_pay_cents_many(hours, rates, tiers)
+            cents = cents.tolist() if np is not None else cents
+            out.write("".join(f"{e},{_format_cents(c)}\n" for e, c in zip(employees, cents)))
+            rows += len(chunk)
+            total_cents += sum(cents)
+    return rows, total_cents
+
+def run_tests():
+    # the experiment's test case must hold in every mode
+    assert gross_pay("45", "10.50") == Decimal("498.75")
+    assert gross_pay_cents(4500, 1050) == 49875
+    assert list(gross_pay_cents_many([4500, 4000, 3000], [1050, 1050, 1050])) == [49875, 42000, 31500]
+
+    # half-cent inputs: gross_pay(), the column path and a CSV run must agree to the cent
+    import os
+    import tempfile
+
+    cases = [("45", "10.505"), ("40.125", "10"), ("40.005", "10.005"), ("0.005", "0.995"), ("39.995", "12.345")]
+    expected = [gross_pay(h, r) for h, r in cases]
+    assert expected[:2] == [Decimal("499.23"), Decimal("401.95")]   # 10.505 -> 10.51, 40.125 h -> 40.13 h
+    columns = gross_pay_cents_many(_parse_hundredths_column(h for h, _ in cases),
+                                   _parse_hundredths_column(r for _, r in cases))
+    assert [Decimal(int(c)).scaleb(-2) for c in columns] == expected
+    with tempfile.TemporaryDirectory() as folder:
+        src, dst = os.path.join(folder, "in.csv"), os.path.join(folder, "out.csv")
+        with open(src, "w") as f:
+            f.write("employee,hours,rate\n\n")
+            f.write("".join(f"E{i},{h},{r}\n\n" for i, (h, r) in enumerate(cases)))
+        assert run_payroll(src, dst, chunk_rows=2)[0] == len(cases)
+        with open(dst) as f:
+            assert [Decimal(line.split(",")[1]) for line in f.read().split()[1:]] == expected
+
+        # no header row: the first line is data; negative pay keeps its sign
+        with open(src, "w") as f:
+            f.write("E1,45,10.50\nE2,1,-0.10\n")
+        assert run_payroll(src, dst) == (2, 49865)
+        with open(dst) as f:
+            assert f.read() == "employee,gross_pay\nE1,498.75\nE2,-0.10\n"
+        assert [_format_cents(c) for c in (-10, -100, -1050, 0, 5)] == ["-0.10", "-1.00", "-10.50", "0.00", "0.05"]
+
+        # a short, long or non-numeric row after the header is reported with its line number
+        for bad in ("E2,40", "E2,40,10,1", "E2,forty,10"):
+            with open(src, "w") as f:
+                f.write(f"employee,hours,rate\nE1,45,10.50\n\n{bad}\n")
+            try:
+                run_payroll(src, dst)
+            except ValueError as error:
+                assert "line 4" in str(error), error
+            else:
+                raise AssertionError(f"no error for {bad!r}")
+    print("All tests passed.")
+
+# Benchmark: rows/sec for a payroll run on a synthetic timesheet file.
+#   Run with:  python 3d-exp.py --bench [rows]
+def benchmark(rows=2_000_000):
+    import os
+    import random
+    import time
+
+    run_tests()
+    path, out_path = "payroll_bench.csv", "payroll_bench_out.csv"
+    with open(path, "w") as f:
+        f.write("employee,hours,rate\n")
+        for i in range(rows):
+            f.write(f"E{i},{random.randint(0, 7000) / 100},{random.randint(1000, 9000) / 100}\n")
+    try:
+        start = time.perf_counter()
+        hours = [random.randint(0, 7000) / 100 for _ in range(100_000)]
+        sum(h * 10.5 if h <= 40 else 40 * 10.5 + (h - 40) * 10.5 * 1.5 for h in hours)
+        elapsed = time.perf_counter() - start
+        print(f"{'float if/else (per row)':<26} {len(hours) / elapsed:14,.0f} rows/sec")
+        start = time.perf_counter()
+        for h in hours[:20_000]:
+            gross_pay(h, "10.50")
+        print(f"{'Decimal gross_pay':<26} {20_000 / (time.perf_counter() - start):14,.0f} rows/sec")
+        start = time.perf_counter()
+        done, total = run_payroll(path, out_path)
+        elapsed = time.perf_counter() - start
+        print(f"{'run_payroll (CSV stream)':<26} {done / elapsed:14,.0f} rows/sec"
+              f"  ({'numpy' if np is not None else 'pure Python'}, total {_format_cents(total)})")
+    finally:
+        os.remove(path)
+        os.remove(out_path)
+
+if __name__ == "__main__":
+    import sys
+    if "--test" in sys.argv:
+        run_tests()
+        sys.exit()
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 2_000_000)
+        sys.exit()
+    if "--payroll" in sys.argv:
+        position = sys.argv.index("--payroll")
+        try:
+            done, total = run_payroll(sys.argv[position + 1], sys.argv[position + 2])
+        except ValueError as error:
+            sys.exit(f"Invalid Input! {error}")
+        print(f"Processed {done} timesheet rows, total gross pay {_format_cents(total)}")
+        sys.exit()
+
+    hrs_input = input("Enter Hours: ")
+    rate_input = input("Enter Rate per Hour: ")
+
+    hrs = float(hrs_input)
+    rate = float(rate_input)
+
+    # Decimal arithmetic on the typed text, so 45 hours at 10.50 gives exactly 498.75
+    pay = gross_pay(hrs_input.strip(), rate_input.strip())
+
+    print("Gross Pay:", pay)
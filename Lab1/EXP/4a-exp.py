@@ -1,24 +1,483 @@
 #4a) Create a list and perform the following methods:
 # insert (), remove (), append (), len(), pop(), clear()
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from heapq import merge
+from itertools import chain, islice
 
-supercars = ["Ferrari 296 GTB", "Lamborghini Revuelto", "McLaren 750s"]
-print("Initial list: ", supercars)
 
-supercars.append("Bugatti Tourbillon")
-print("\nAfter append('Bugatti Tourbillon'): ", supercars)
+# A Python list stores all items in one array, so insert(0, x) / pop(0) / remove(x) shift
+# every item after the position: O(n) per call. A BlockedList (unrolled list) keeps the
+# items in many small lists ("blocks") of about LOAD items, so an edit only shifts the
+# items of one block.
+#   _blocks  -> [[items ...], [items ...], ...]
+#   _tree    -> Fenwick (binary indexed) tree over the block lengths, so the block holding
+#               position i is found in O(log m) for m blocks, instead of summing lengths
+# A positional edit costs O(log m + LOAD). A block that grows past 2 * LOAD is split in half
+# and an empty block is dropped; both rebuild the tree in O(m), once per ~LOAD edits.
+# _BlockSequence holds the blocks and everything that reads them or deletes by position;
+# BlockedList adds the list methods that put items anywhere, SortedCollection adds sorted ones.
+class _BlockSequence:
+    LOAD = 1000
 
-supercars.insert(1, "Porsche 911 GT3 RS")
-print("\nAfter insert(1, 'Porsche 911 GT3 RS'): ", supercars)
+    def __init__(self, load=None):
+        if load is not None:
+            self.LOAD = load
+        self._blocks = []
+        self._tree = [0]
+        self._len = 0
 
-total_cars = len(supercars)
-print(f"Current total number of cars: {total_cars}")
+    def _rebuild(self):
+        # O(m) Fenwick build: every node adds itself to its parent
+        tree = [0]
+        tree.extend(map(len, self._blocks))
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
 
-supercars.remove("McLaren 750s")
-print("\nAfter remove('McLaren 750s'): ", supercars)
+    def _grow(self, block_no, delta):
+        tree = self._tree
+        i = block_no + 1
+        size = len(tree)
+        while i < size:
+            tree[i] += delta
+            i += i & -i
 
-popped_car = supercars.pop(0)
-print(f"After pop(0) : {supercars}")
-print(f"The car that was 'popped' (removed) was : {popped_car}")
+    def _locate(self, index):
+        # -> (block number, offset in block) for 0 <= index < len(self)
+        if index < len(self._blocks[0]):
+            return 0, index
+        last = len(self._blocks) - 1
+        tail_start = self._len - len(self._blocks[last])
+        if index >= tail_start:
+            return last, index - tail_start
+        tree = self._tree
+        size = len(tree)
+        block_no = 0
+        bit = 1 << (size.bit_length() - 1)
+        while bit:
+            nxt = block_no + bit
+            if nxt < size and tree[nxt] <= index:
+                index -= tree[nxt]
+                block_no = nxt
+            bit >>= 1
+        return block_no, index
 
-supercars.clear()
-print("\nAfter clear(): ", supercars)
+    def _position(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        return index
+
+    def _split(self, block_no):
+        block = self._blocks[block_no]
+        half = len(block) >> 1
+        self._blocks[block_no:block_no + 1] = [block[:half], block[half:]]
+        self._rebuild()
+
+    def _shrunk(self, block_no):
+        # called after an item was deleted from the block
+        if not self._blocks[block_no]:
+            del self._blocks[block_no]
+            self._rebuild()
+
+    def pop(self, index=-1):
+        if not self._len:
+            raise IndexError("pop from empty list")
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("pop index out of range")
+        block_no, offset = self._locate(index)
+        item = self._blocks[block_no].pop(offset)
+        self._grow(block_no, -1)
+        self._len -= 1
+        self._shrunk(block_no)
+        return item
+
+    def clear(self):
+        self._blocks = []
+        self._tree = [0]
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self):
+        return chain.from_iterable(map(reversed, reversed(self._blocks)))
+
+    def __contains__(self, item):
+        return any(item in block for block in self._blocks)
+
+    def _range(self, start, stop):
+        # items start..stop-1 as a list: O(log m) to find start, then whole-block slices
+        if start >= stop:
+            return []
+        block_no, offset = self._locate(start)
+        result = []
+        need = stop - start
+        while need > 0:
+            part = self._blocks[block_no][offset:offset + need]
+            result.extend(part)
+            need -= len(part)
+            block_no += 1
+            offset = 0
+        return result
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step > 0:
+                items = self._range(start, stop)
+                return type(self)(items if step == 1 else items[::step], self.LOAD)
+            # negative step: take the covered range once, then walk it backwards
+            items = self._range(stop + 1, start + 1)[::-1]
+            return type(self)(items[::-step], self.LOAD)
+        block_no, offset = self._locate(self._position(index))
+        return self._blocks[block_no][offset]
+
+    def __delitem__(self, index):
+        self.pop(self._position(index))
+
+    def __eq__(self, other):
+        if isinstance(other, (_BlockSequence, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+class BlockedList(_BlockSequence):
+    def __init__(self, iterable=None, load=None):
+        super().__init__(load)
+        if iterable is not None:
+            self.extend(iterable)
+
+    def append(self, item):
+        if not self._blocks:
+            self._blocks.append([item])
+            self._rebuild()
+        else:
+            last = len(self._blocks) - 1
+            self._blocks[last].append(item)
+            self._grow(last, 1)
+            if len(self._blocks[last]) > 2 * self.LOAD:
+                self._split(last)
+        self._len += 1
+
+    def extend(self, iterable):
+        items = iter(iterable)
+        if self._blocks:
+            # top up the last block first, so extend() never leaves small blocks behind
+            last = self._blocks[-1]
+            last.extend(islice(items, max(self.LOAD - len(last), 0)))
+        while True:
+            block = list(islice(items, self.LOAD))
+            if not block:
+                break
+            self._blocks.append(block)
+        self._len = sum(map(len, self._blocks))
+        self._rebuild()
+
+    def insert(self, index, item):
+        # same index rules as list.insert(): negative counts from the end, out of range clamps
+        if index < 0:
+            index = max(index + self._len, 0)
+        if index >= self._len:
+            self.append(item)
+            return
+        block_no, offset = self._locate(index)
+        block = self._blocks[block_no]
+        block.insert(offset, item)
+        self._grow(block_no, 1)
+        self._len += 1
+        if len(block) > 2 * self.LOAD:
+            self._split(block_no)
+
+    def remove(self, item):
+        # a value search is still a scan, but it runs block by block in C and the delete
+        # itself only shifts one block
+        for block_no, block in enumerate(self._blocks):
+            if item in block:
+                block.remove(item)
+                self._grow(block_no, -1)
+                self._len -= 1
+                self._shrunk(block_no)
+                return
+        raise ValueError("BlockedList.remove(x): x not in list")
+
+    def __setitem__(self, index, item):
+        block_no, offset = self._locate(self._position(index))
+        self._blocks[block_no][offset] = item
+
+# A SortedCollection keeps its items in sorted order on top of the same blocks. Every block
+# is sorted, and _maxes[b] is the largest item of block b, so two bisects (one over _maxes,
+# one inside a block) find where a value lives: O(log n) add / discard / `in`, and index()
+# adds the sizes of the blocks before it through the Fenwick tree.
+# Membership alone is answered by _counts, a hash Counter of the items: on a big catalog a
+# bisect is a dozen string compares at scattered memory addresses, a hash lookup is one.
+# Items go in with add() / update(). It is not a BlockedList: append(), insert() and item
+# assignment would break the order, so it has no append() / insert() and c[i] = x is a TypeError.
+class SortedCollection(_BlockSequence):
+    def __init__(self, iterable=None, load=None):
+        self._maxes = []
+        self._counts = Counter()
+        super().__init__(load=load)
+        if iterable is not None:
+            self.update(iterable)
+
+    def _rebuild(self):
+        super()._rebuild()
+        self._maxes = [block[-1] for block in self._blocks]
+
+    def _shrunk(self, block_no):
+        if self._blocks[block_no]:
+            self._maxes[block_no] = self._blocks[block_no][-1]
+        super()._shrunk(block_no)
+
+    def _start(self, block_no):
+        # number of items in the blocks before block_no (Fenwick prefix sum)
+        tree = self._tree
+        total = 0
+        while block_no:
+            total += tree[block_no]
+            block_no -= block_no & -block_no
+        return total
+
+    def add(self, value):
+        self._counts[value] += 1
+        if not self._blocks:
+            self._blocks.append([value])
+            self._len = 1
+            self._rebuild()
+            return
+        block_no = bisect_left(self._maxes, value)
+        if block_no == len(self._blocks):
+            block_no -= 1
+            self._blocks[block_no].append(value)
+            self._maxes[block_no] = value
+        else:
+            insort(self._blocks[block_no], value)
+        self._grow(block_no, 1)
+        self._len += 1
+        if len(self._blocks[block_no]) > 2 * self.LOAD:
+            self._split(block_no)
+
+    def update(self, iterable):
+        values = sorted(iterable)
+        if len(values) <= self._len >> 3:
+            for value in values:
+                self.add(value)
+            return
+        # a large batch: sort it once, then one linear merge with the current items
+        self._counts.update(values)
+        if self._len:
+            values = list(merge(chain.from_iterable(self._blocks), values))
+        self._blocks = [values[i:i + self.LOAD] for i in range(0, len(values), self.LOAD)]
+        self._len = len(values)
+        self._rebuild()
+
+    def _find(self, value):
+        # -> (block number, offset) of the first item equal to value, or None
+        if value not in self._counts:
+            return None
+        block_no = bisect_left(self._maxes, value)
+        if block_no == len(self._blocks):
+            return None
+        block = self._blocks[block_no]
+        offset = bisect_left(block, value)
+        return (block_no, offset) if block[offset] == value else None
+
+    def __contains__(self, value):
+        return value in self._counts
+
+    def _forget(self, value):
+        if self._counts[value] == 1:
+            del self._counts[value]
+        else:
+            self._counts[value] -= 1
+
+    def discard(self, value):
+        found = self._find(value)
+        if found is not None:
+            block_no, offset = found
+            self._forget(self._blocks[block_no].pop(offset))
+            self._grow(block_no, -1)
+            self._len -= 1
+            self._shrunk(block_no)
+
+    def pop(self, index=-1):
+        value = super().pop(index)
+        self._forget(value)
+        return value
+
+    def clear(self):
+        super().clear()
+        self._maxes = []
+        self._counts = Counter()
+
+    def remove(self, value):
+        if value not in self:
+            raise ValueError(f"{value!r} not in SortedCollection")
+        self.discard(value)
+
+    def index(self, value):
+        found = self._find(value)
+        if found is None:
+            raise ValueError(f"{value!r} is not in SortedCollection")
+        return self._start(found[0]) + found[1]
+
+    def bisect_left(self, value):
+        block_no = bisect_left(self._maxes, value)
+        if block_no == len(self._blocks):
+            return self._len
+        return self._start(block_no) + bisect_left(self._blocks[block_no], value)
+
+    def bisect_right(self, value):
+        block_no = bisect_right(self._maxes, value)
+        if block_no == len(self._blocks):
+            return self._len
+        return self._start(block_no) + bisect_right(self._blocks[block_no], value)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        # iterate over the items from minimum to maximum (None = unbounded) in sorted order,
+        # e.g. irange("B", "M") -> every name from "B" up to and including exactly "M"
+        start = 0
+        if minimum is not None:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+        stop = self._len
+        if maximum is not None:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+        if start >= stop:
+            return iter(())
+        block_no, offset = self._locate(start)
+        blocks = chain([self._blocks[block_no][offset:]], islice(self._blocks, block_no + 1, None))
+        return islice(chain.from_iterable(blocks), stop - start)
+
+    def __setitem__(self, index, value):
+        # without this, `del c[i]` being allowed makes Python report AttributeError here
+        raise TypeError("SortedCollection is ordered; use add()")
+
+# Benchmark: list vs collections.deque vs BlockedList for edits at the front, the middle
+# and the tail of a long sequence.
+#   Run with:  python 4a-exp.py --bench [n]
+def benchmark(n=1_000_000, ops=20_000):
+    import time
+    from collections import deque
+
+    def front(seq):
+        for i in range(ops):
+            seq.insert(0, i)
+        for _ in range(ops):
+            del seq[0]
+
+    def middle(seq):
+        for i in range(ops):
+            seq.insert(len(seq) >> 1, i)
+        for _ in range(ops):
+            del seq[len(seq) >> 1]
+
+    def tail(seq):
+        for i in range(ops):
+            seq.append(i)
+        for _ in range(ops):
+            del seq[-1]
+
+    print(f"{2 * ops:,} edits on a sequence of {n:,} items (ops/sec)")
+    print(f"{'workload':<10} {'list':>14} {'deque':>14} {'BlockedList':>14}")
+    for label, workload in (("front", front), ("middle", middle), ("tail", tail)):
+        row = []
+        for make in (list, deque, BlockedList):
+            seq = make(range(n))
+            start = time.perf_counter()
+            workload(seq)
+            row.append(2 * ops / (time.perf_counter() - start))
+        print(f"{label:<10} {row[0]:14,.0f} {row[1]:14,.0f} {row[2]:14,.0f}")
+
+# Benchmark: a plain list of names vs SortedCollection on a large catalog.
+#   Run with:  python 4a-exp.py --sorted-bench [n]
+def benchmark_sorted(n=5_000_000, lookups=200_000):
+    import random
+    import time
+
+    names = [f"{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}model-{i:08d}" for i in range(n)]
+    random.shuffle(names)
+    probes = random.sample(names, lookups)
+    slow = probes[:20]            # linear scans are too slow for every probe
+
+    def timed(label, func, count):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<34} {elapsed / count * 1e6:12.3f} us/op")
+
+    print(f"Catalog of {n:,} names")
+    plain = []
+    timed("list build", lambda: plain.extend(names), n)
+    catalog = SortedCollection()
+    timed("SortedCollection build (update)", lambda: catalog.update(names), n)
+    timed("list `in`", lambda: [name in plain for name in slow], len(slow))
+    timed("SortedCollection `in`", lambda: [name in catalog for name in probes], lookups)
+    timed("list.index", lambda: [plain.index(name) for name in slow], len(slow))
+    timed("SortedCollection.index", lambda: [catalog.index(name) for name in probes], lookups)
+    timed("SortedCollection.irange('B', 'M')", lambda: sum(1 for _ in catalog.irange("B", "M")), 1)
+    timed("list.remove", lambda: [plain.remove(name) for name in slow], len(slow))
+    timed("SortedCollection.discard", lambda: [catalog.discard(name) for name in probes], lookups)
+    timed("SortedCollection.add", lambda: [catalog.add(name) for name in probes], lookups)
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
+        sys.exit()
+    if "--sorted-bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--sorted-bench"]
+        benchmark_sorted(int(args[0]) if args else 5_000_000)
+        sys.exit()
+
+    supercars = ["Ferrari 296 GTB", "Lamborghini Revuelto", "McLaren 750s"]
+    print("Initial list: ", supercars)
+
+    supercars.append("Bugatti Tourbillon")
+    print("\nAfter append('Bugatti Tourbillon'): ", supercars)
+
+    supercars.insert(1, "Porsche 911 GT3 RS")
+    print("\nAfter insert(1, 'Porsche 911 GT3 RS'): ", supercars)
+
+    total_cars = len(supercars)
+    print(f"Current total number of cars: {total_cars}")
+
+    supercars.remove("McLaren 750s")
+    print("\nAfter remove('McLaren 750s'): ", supercars)
+
+    popped_car = supercars.pop(0)
+    print(f"After pop(0) : {supercars}")
+    print(f"The car that was 'popped' (removed) was : {popped_car}")
+
+    supercars.clear()
+    print("\nAfter clear(): ", supercars)
+
+    # The same steps on a BlockedList, the version meant for inventories of millions of cars
+    inventory = BlockedList(["Ferrari 296 GTB", "Lamborghini Revuelto", "McLaren 750s"])
+    inventory.append("Bugatti Tourbillon")
+    inventory.insert(1, "Porsche 911 GT3 RS")
+    inventory.remove("McLaren 750s")
+    popped_car = inventory.pop(0)
+    print(f"\nBlockedList after append, insert, remove and pop(0): {list(inventory)} ({len(inventory)} cars)")
+    inventory.clear()
+
+    # A SortedCollection loaded from the same cars: membership and remove() use binary search
+    catalog = SortedCollection(["Ferrari 296 GTB", "Lamborghini Revuelto", "McLaren 750s"])
+    catalog.update(["Bugatti Tourbillon", "Porsche 911 GT3 RS"])
+    catalog.remove("McLaren 750s")
+    print(f"\nSorted catalog: {list(catalog)}")
+    print(f"'Porsche 911 GT3 RS' in catalog: {'Porsche 911 GT3 RS' in catalog}, at index {catalog.index('Porsche 911 GT3 RS')}")
+    print(f"Cars from 'B' to 'M': {list(catalog.irange('B', 'M'))}")
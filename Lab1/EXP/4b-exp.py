@@ -1,28 +1,295 @@
-# 4b) Create a dictionary and apply the following methods: 
+# 4b) Create a dictionary and apply the following methods:
 #     Print the dictionary items, Access items, Use get(), Change values(), Use len()
-suvs = {
-    "Range Rover Autobiography": "Land Rover",
-    "G Wagon": "Mercedes-Benz",
-    "Cullinan": "Rolls-Royce",
-    "Urus": "Lamborghini",
-    "Defender": "Land Rover"
-}
-
-print("--- Dictionary Items ---")
-print(suvs.items()) 
-print("Full Dictionary:", suvs)
-
-model = "G Wagon"
-brand = suvs[model]
-print(f"\nAccessing via brackets: The {model} is made by {brand}.")
-
-suv_search = "Cullinan"
-brand_search = suvs.get(suv_search)
-print(f"Accessing via get(): The {suv_search} is made by {brand_search}.")
-
-print("\nChanging value for 'Urus'...")
-suvs["Urus"] = "Lamborghini (Performance Division)"
-print("Updated Dictionary:", suvs)
-
-count = len(suvs)
-print(f"\nTotal number of SUVs in the dictionary: {count}")
\ No newline at end of file
+import os
+import tempfile
+from array import array
+from collections.abc import ItemsView, MutableMapping, ValuesView
+
+from disk_dict import DiskDict
+
+
+# Dictionary encoding for values that repeat a lot (millions of models, a few hundred brands).
+# Every distinct value is stored once in a code table and each key only keeps a 2-byte code:
+#   _values      -> [value for code 0, value for code 1, ...]      (at most 65536 in use)
+#   _code_of     -> (type(value), value) -> code, so True, 1 and 1.0 keep separate codes
+#   _keys        -> every key, in one dense list; position p belongs to _keys[p]
+#   _codes       -> array('H'): _codes[p] is the value code of _keys[p]
+#   _slots       -> array('i') open-addressing hash index: hash(key) -> position
+# A dict would also need an int object per position, so the key -> position index is kept in
+# a typed array instead, which costs 4 bytes a slot instead of a full dict entry.
+# Reverse index: _groups[code] is an array of the positions with that code, and
+# _group_pos[p] is where p sits in its group, so a key moves between groups in O(1).
+# The group size is the code's reference count: when the last key leaves a group its code
+# goes on the _free list and is handed out again, so only values in use count to the limit.
+# Deleting a key moves the last key into its position, so iteration order is insertion
+# order only until the first delete.
+EMPTY = -1
+DELETED = -2
+
+class _EncodedItemsView(ItemsView):
+    def __iter__(self):
+        mapping = self._mapping
+        return zip(mapping._keys, map(mapping._values.__getitem__, mapping._codes))
+
+class _EncodedValuesView(ValuesView):
+    def __iter__(self):
+        return map(self._mapping._values.__getitem__, self._mapping._codes)
+
+class EncodedDict(MutableMapping):
+    def __init__(self, items=()):
+        self._values = []
+        self._code_of = {}
+        self._groups = []
+        self._free = []
+        self._keys = []
+        self._codes = array("H")
+        self._group_pos = array("i")
+        self._slots = array("i", [EMPTY]) * 8
+        self._deleted = 0
+        self.update(items)
+
+    def _find(self, key):
+        # -> (slot, position); position is -1 if key is missing, and slot is then where it goes
+        slots = self._slots
+        keys = self._keys
+        mask = len(slots) - 1
+        i = hash(key) & mask
+        free = -1
+        while True:
+            position = slots[i]
+            if position == EMPTY:
+                return (i if free < 0 else free), -1
+            if position == DELETED:
+                if free < 0:
+                    free = i
+            elif keys[position] == key:
+                return i, position
+            i = (i + 1) & mask
+
+    def _rebuild(self, capacity):
+        slots = array("i", [EMPTY]) * capacity
+        mask = capacity - 1
+        for position, key in enumerate(self._keys):
+            i = hash(key) & mask
+            while slots[i] != EMPTY:
+                i = (i + 1) & mask
+            slots[i] = position
+        self._slots = slots
+        self._deleted = 0
+
+    def _code(self, value):
+        code = self._code_of.get((type(value), value))
+        if code is None:
+            if self._free:
+                code = self._free.pop()
+                self._values[code] = value
+            else:
+                code = len(self._values)
+                if code > 0xFFFF:
+                    raise ValueError("EncodedDict holds at most 65536 distinct values")
+                self._values.append(value)
+                self._groups.append(array("i"))
+            self._code_of[(type(value), value)] = code
+        return code
+
+    def _join_group(self, position, code):
+        group = self._groups[code]
+        self._group_pos[position] = len(group)
+        group.append(position)
+
+    def _leave_group(self, position):
+        group = self._groups[self._codes[position]]
+        last = group[-1]
+        group[self._group_pos[position]] = last
+        self._group_pos[last] = self._group_pos[position]
+        group.pop()
+        if not group:
+            # no key uses this value any more: release its code
+            code = self._codes[position]
+            value = self._values[code]
+            del self._code_of[(type(value), value)]
+            self._values[code] = None
+            self._free.append(code)
+
+    def __getitem__(self, key):
+        position = self._find(key)[1]
+        if position < 0:
+            raise KeyError(key)
+        return self._values[self._codes[position]]
+
+    def __contains__(self, key):
+        return self._find(key)[1] >= 0
+
+    def __setitem__(self, key, value):
+        slot, position = self._find(key)    # first, so an unhashable key cannot leave a code behind
+        code = self._code(value)
+        if position >= 0:
+            if self._codes[position] != code:
+                self._leave_group(position)
+                self._codes[position] = code
+                self._join_group(position, code)
+            return
+        position = len(self._keys)
+        self._keys.append(key)
+        self._codes.append(code)
+        self._group_pos.append(0)
+        self._join_group(position, code)
+        if self._slots[slot] == DELETED:
+            self._deleted -= 1
+        self._slots[slot] = position
+        if 3 * (len(self._keys) + self._deleted) > 2 * len(self._slots):
+            capacity = 8
+            while capacity < 2 * len(self._keys):
+                capacity *= 2
+            self._rebuild(capacity)
+
+    def __delitem__(self, key):
+        slot, position = self._find(key)
+        if position < 0:
+            raise KeyError(key)
+        self._slots[slot] = DELETED
+        self._deleted += 1
+        self._leave_group(position)
+        last = len(self._keys) - 1
+        if position != last:
+            # move the last key into the hole, so the arrays stay dense
+            moved = self._keys[last]
+            self._slots[self._find(moved)[0]] = position
+            self._keys[position] = moved
+            self._codes[position] = self._codes[last]
+            self._group_pos[position] = self._group_pos[last]
+            self._groups[self._codes[last]][self._group_pos[last]] = position
+        self._keys.pop()
+        self._codes.pop()
+        self._group_pos.pop()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def items(self):
+        return _EncodedItemsView(self)
+
+    def values(self):
+        return _EncodedValuesView(self)
+
+    def keys_for(self, value):
+        # reverse lookup, e.g. every model of one brand: O(1) to find the group
+        code = self._code_of.get((type(value), value))
+        if code is None:
+            return []
+        return list(map(self._keys.__getitem__, self._groups[code]))
+
+    def count_of(self, value):
+        code = self._code_of.get((type(value), value))
+        return 0 if code is None else len(self._groups[code])
+
+    def distinct_values(self):
+        return [value for value, group in zip(self._values, self._groups) if group]
+
+    def __repr__(self):
+        return f"EncodedDict({dict(self.items())!r})"
+
+# Memory report: a plain dict vs EncodedDict with N models -> a few hundred brands.
+#   Run with:  python 4b-exp.py --bench [N]
+# Each table is built in its own process and its peak RSS is compared against a process that
+# only holds the keys. Values are split out of text lines, the way they arrive from a file,
+# so a plain dict gets a separate string object for every value.
+BENCH_BRANDS = 300
+
+def _measure(kind, n):
+    import resource
+    import sys
+    import time
+
+    brands = [f"Brand {b:03d}" for b in range(BENCH_BRANDS)]
+    rows = (f"model-{i:08d},{brands[i % BENCH_BRANDS]}".split(",") for i in range(n))
+    start = time.perf_counter()
+    if kind == "keys only":
+        table = [key for key, _ in rows]
+    elif kind == "dict":
+        table = dict(rows)
+    elif kind == "dict (interned)":
+        table = {key: sys.intern(value) for key, value in rows}
+    else:
+        table = EncodedDict(rows)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_kb //= 1024      # macOS reports bytes
+    probe = f"model-{n // 2:08d}"
+    assert table[n // 2] == probe if kind == "keys only" else table[probe] == brands[n // 2 % BENCH_BRANDS]
+    print(f"{kind},{peak_kb},{elapsed}")
+
+def benchmark(n=10_000_000):
+    import subprocess
+    import sys
+
+    print(f"{n:,} keys -> {BENCH_BRANDS} distinct values")
+    results = {}
+    for kind in ("keys only", "dict", "dict (interned)", "EncodedDict"):
+        out = subprocess.run([sys.executable, __file__, "--measure", kind, str(n)],
+                             check=True, capture_output=True, text=True).stdout
+        _, peak_kb, elapsed = out.strip().rsplit(",", 2)
+        results[kind] = int(peak_kb) / 1024
+        extra = results[kind] - results["keys only"]
+        print(f"{kind:<16} build {float(elapsed):7.2f} s  peak RSS {results[kind]:9.1f} MB"
+              f"  ({extra * (1 << 20) / n:6.1f} bytes/key on top of the keys)")
+    for kind in ("dict", "dict (interned)"):
+        saved = results[kind] - results["EncodedDict"]
+        print(f"EncodedDict saves {saved:9.1f} MB ({saved / results[kind]:.0%}) against {kind}")
+
+if __name__ == "__main__":
+    import sys
+    if "--measure" in sys.argv:
+        position = sys.argv.index("--measure")
+        _measure(sys.argv[position + 1], int(sys.argv[position + 2]))
+        sys.exit()
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 10_000_000)
+        sys.exit()
+
+    suvs = {
+        "Range Rover Autobiography": "Land Rover",
+        "G Wagon": "Mercedes-Benz",
+        "Cullinan": "Rolls-Royce",
+        "Urus": "Lamborghini",
+        "Defender": "Land Rover"
+    }
+
+    print("--- Dictionary Items ---")
+    print(suvs.items())
+    print("Full Dictionary:", suvs)
+
+    model = "G Wagon"
+    brand = suvs[model]
+    print(f"\nAccessing via brackets: The {model} is made by {brand}.")
+
+    suv_search = "Cullinan"
+    brand_search = suvs.get(suv_search)
+    print(f"Accessing via get(): The {suv_search} is made by {brand_search}.")
+
+    print("\nChanging value for 'Urus'...")
+    suvs["Urus"] = "Lamborghini (Performance Division)"
+    print("Updated Dictionary:", suvs)
+
+    count = len(suvs)
+    print(f"\nTotal number of SUVs in the dictionary: {count}")
+
+    # The same operations on a DiskDict: the table lives in files on disk instead of RAM, for
+    # tables that are too big for a dict.
+    with tempfile.TemporaryDirectory() as folder:
+        with DiskDict(os.path.join(folder, "suvs.db")) as disk_suvs:
+            disk_suvs.update(suvs)
+            disk_suvs["Urus"] = "Lamborghini"
+            print(f"\nDiskDict: the {model} is made by {disk_suvs[model]}, "
+                  f"the Urus by {disk_suvs.get('Urus')}, {len(disk_suvs)} SUVs stored on disk.")
+
+    # And on an EncodedDict: "Land Rover" is stored once, and brand -> models is one lookup
+    encoded_suvs = EncodedDict(suvs)
+    encoded_suvs["Urus"] = "Lamborghini"
+    print(f"\nEncodedDict items: {list(encoded_suvs.items())}")
+    print(f"Land Rover models: {encoded_suvs.keys_for('Land Rover')}")
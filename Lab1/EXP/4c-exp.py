@@ -1,25 +1,325 @@
 #4c) Create a tuple and perform the following methods:Add item(), len(), Check for item in tuple, Access items
-luxury_sedans = ("Rolls Royce Phantom", "Bentley Mulsanne", "Maybach S-class")
+from itertools import chain, islice
 
-print("Original Tuple: ", luxury_sedans)
 
-first_car = luxury_sedans[0]
-last_car = luxury_sedans[-1]
+# "Adding" to a tuple copies all of it (tuple -> list -> append -> tuple), so keeping every
+# version of a growing tuple costs O(n) time and memory per version. A PVector is an
+# immutable sequence where append(), set() and slicing return a NEW version that shares
+# almost everything with the old one:
+#   _root  -> 32-way trie: inner nodes are lists of up to 32 children, leaves hold 32 items
+#   _tail  -> the last (up to 32) items, kept out of the trie so append() is usually O(1)
+#   _shift -> 5 * (trie depth); item i sits under child (i >> level) & 31 at each level
+# append() / set() copy only the nodes on one root-to-leaf path: O(log32 n) nodes of 32
+# slots, so a version of a million items shares all but ~4 nodes with the previous one.
+# Nodes are never modified after they are built, which is what makes sharing safe.
+# A slice is a window (_start, _len) over the same trie, so it is O(1) too. Items outside
+# the window stay referenced until the window itself is dropped.
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
 
-print(f"\nFirst Item: {first_car}")
-print(f"Last Item: {last_car}")
+def _tail_offset(count):
+    return 0 if count < WIDTH else ((count - 1) >> BITS) << BITS
 
-print(f"\nThe tuple contains {len(luxury_sedans)} luxury sedans.")
+def _new_path(level, node):
+    while level:
+        node = [node]
+        level -= BITS
+    return node
 
-search_car = "Bentley Mulsanne"
-if search_car in luxury_sedans:
-    print(f"Yes, '{search_car}' is in the tuple.")
-else:
-    print(f"No, '{search_car}' is not in the tuple.")
+def _push_tail(count, level, parent, tail):
+    # copy of parent with the full tail added as the last leaf below it
+    node = parent[:]
+    index = ((count - 1) >> level) & MASK
+    if level == BITS:
+        child = tail
+    elif index < len(parent):
+        child = _push_tail(count, level - BITS, parent[index], tail)
+    else:
+        child = _new_path(level - BITS, tail)
+    if index < len(node):
+        node[index] = child
+    else:
+        node.append(child)
+    return node
 
-temp_list = list(luxury_sedans)
-temp_list.append("Aston Martin Rapide")
-luxury_sedans = tuple(temp_list)
+def _assoc(level, node, i, item):
+    node = node[:]
+    if level == 0:
+        node[i & MASK] = item
+    else:
+        index = (i >> level) & MASK
+        node[index] = _assoc(level - BITS, node[index], i, item)
+    return node
 
-print("\nAfter adding a new item (via list conversion):")
-print(luxury_sedans)
+class PVector:
+    __slots__ = ("_count", "_shift", "_root", "_tail", "_start", "_len", "_hash")
+
+    def __new__(cls, iterable=()):
+        items = list(iterable)
+        count = len(items)
+        tail_offset = _tail_offset(count)
+        # bulk build: cut the items into leaves, then group 32 nodes per level until one
+        # root is left; O(n) instead of n separate appends
+        nodes = [items[i:i + WIDTH] for i in range(0, tail_offset, WIDTH)]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [nodes[i:i + WIDTH] for i in range(0, len(nodes), WIDTH)]
+            shift += BITS
+        return cls._make(count, shift, nodes, items[tail_offset:], 0, count)
+
+    @classmethod
+    def _make(cls, count, shift, root, tail, start, length):
+        vector = object.__new__(cls)
+        vector._count = count
+        vector._shift = shift
+        vector._root = root
+        vector._tail = tail
+        vector._start = start
+        vector._len = length
+        vector._hash = None
+        return vector
+
+    def _leaf(self, i):
+        # the node holding trie index i (a trie leaf or the tail) and the index of its first item
+        tail_offset = _tail_offset(self._count)
+        if i >= tail_offset:
+            return self._tail, tail_offset
+        node = self._root
+        for level in range(self._shift, 0, -BITS):
+            node = node[(i >> level) & MASK]
+        return node, i & ~MASK
+
+    def _position(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("PVector index out of range")
+        return self._start + index
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return self._make(self._count, self._shift, self._root, self._tail,
+                                  self._start + start, max(stop - start, 0))
+            return PVector(islice(self, start, stop, step) if step > 0 else
+                           [self[i] for i in range(start, stop, step)])
+        i = self._position(index)
+        leaf, first = self._leaf(i)
+        return leaf[i - first]
+
+    def _append_trie(self, item):
+        count, shift, root, tail = self._count, self._shift, self._root, self._tail
+        if count - _tail_offset(count) < WIDTH:
+            return count + 1, shift, root, tail + [item]
+        # the tail is full: it becomes a leaf of the trie, and a new tail starts
+        if (count >> BITS) > (1 << shift):
+            root = [root, _new_path(shift, tail)]        # the root is full: one level deeper
+            shift += BITS
+        else:
+            root = _push_tail(count, shift, root, tail)
+        return count + 1, shift, root, [item]
+
+    def _set_trie(self, i, item):
+        tail_offset = _tail_offset(self._count)
+        if i >= tail_offset:
+            tail = self._tail[:]
+            tail[i - tail_offset] = item
+            return self._root, tail
+        return _assoc(self._shift, self._root, i, item), self._tail
+
+    def append(self, item):
+        end = self._start + self._len
+        if end == self._count:
+            count, shift, root, tail = self._append_trie(item)
+            return self._make(count, shift, root, tail, self._start, self._len + 1)
+        # a slice that ends before the trie does: write the item into the next trie index
+        root, tail = self._set_trie(end, item)
+        return self._make(self._count, self._shift, root, tail, self._start, self._len + 1)
+
+    def extend(self, iterable):
+        vector = self
+        for item in iterable:
+            vector = vector.append(item)
+        return vector
+
+    def set(self, index, item):
+        root, tail = self._set_trie(self._position(index), item)
+        return self._make(self._count, self._shift, root, tail, self._start, self._len)
+
+    def _chunks(self, reverse=False):
+        # the window as consecutive leaf slices, so per-item work runs in C
+        i, stop = self._start, self._start + self._len
+        chunks = []
+        while i < stop:
+            leaf, first = self._leaf(i)
+            chunk = leaf[i - first:stop - first]
+            if not reverse:
+                yield chunk
+            else:
+                chunks.append(chunk)
+            i += len(chunk)
+        if reverse:
+            for chunk in reversed(chunks):
+                yield chunk[::-1]
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks())
+
+    def __reversed__(self):
+        return chain.from_iterable(self._chunks(reverse=True))
+
+    def __contains__(self, item):
+        return any(item in chunk for chunk in self._chunks())
+
+    def index(self, item):
+        offset = 0
+        for chunk in self._chunks():
+            if item in chunk:
+                return offset + chunk.index(item)
+            offset += len(chunk)
+        raise ValueError("PVector.index(x): x not in PVector")
+
+    def count(self, item):
+        return sum(chunk.count(item) for chunk in self._chunks())
+
+    def __hash__(self):
+        # same value as the equal tuple; computed once, since the vector never changes
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def _compare(self, other, op):
+        # tuple rules: the first differing item decides, else the shorter vector is smaller
+        if not isinstance(other, PVector):
+            return NotImplemented
+        for a, b in zip(self, other):
+            if not (a is b or a == b):
+                return op(a, b)
+        return op(len(self), len(other))
+
+    def __eq__(self, other):
+        if not isinstance(other, PVector):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if self._root is other._root and self._tail is other._tail and self._start == other._start:
+            return True
+        return all(a is b or a == b for a, b in zip(self, other))
+
+    def __lt__(self, other):
+        return self._compare(other, lambda a, b: a < b)
+
+    def __le__(self, other):
+        return self._compare(other, lambda a, b: a <= b)
+
+    def __gt__(self, other):
+        return self._compare(other, lambda a, b: a > b)
+
+    def __ge__(self, other):
+        return self._compare(other, lambda a, b: a >= b)
+
+    def __repr__(self):
+        return f"PVector({list(self)!r})"
+
+# Benchmark: keeping every version while adding/changing items, tuple copies vs PVector.
+#   Run with:  python 4c-exp.py --bench [n]
+def benchmark(n=100_000, versions=2_000):
+    import random
+    import time
+    import tracemalloc
+
+    base = tuple(range(n))
+    positions = [random.randrange(n) for _ in range(versions)]
+
+    def tuple_append():
+        snapshots = [base]
+        for i in range(versions):
+            temp_list = list(snapshots[-1])
+            temp_list.append(i)
+            snapshots.append(tuple(temp_list))
+        return snapshots
+
+    def tuple_set():
+        snapshots = [base]
+        for i in positions:
+            t = snapshots[-1]
+            snapshots.append(t[:i] + (-1,) + t[i + 1:])
+        return snapshots
+
+    vector = PVector(base)
+
+    def vector_append():
+        snapshots = [vector]
+        for i in range(versions):
+            snapshots.append(snapshots[-1].append(i))
+        return snapshots
+
+    def vector_set():
+        snapshots = [vector]
+        for i in positions:
+            snapshots.append(snapshots[-1].set(i, -1))
+        return snapshots
+
+    print(f"{versions:,} versions of a {n:,}-item sequence, every version kept")
+    for label, func in (("tuple copy + append", tuple_append), ("PVector.append", vector_append),
+                        ("tuple copy + set", tuple_set), ("PVector.set", vector_set)):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        snapshots = func()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del snapshots
+        print(f"{label:<22} {versions / elapsed:14,.0f} versions/sec {memory / (1 << 20):10.1f} MB")
+
+    for label, func in (("tuple[i]", lambda: [base[i] for i in positions]),
+                        ("PVector[i]", lambda: [vector[i] for i in positions])):
+        start = time.perf_counter()
+        func()
+        print(f"{label:<22} {(time.perf_counter() - start) / versions * 1e9:14,.0f} ns/lookup")
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 100_000)
+        sys.exit()
+
+    luxury_sedans = ("Rolls Royce Phantom", "Bentley Mulsanne", "Maybach S-class")
+
+    print("Original Tuple: ", luxury_sedans)
+
+    first_car = luxury_sedans[0]
+    last_car = luxury_sedans[-1]
+
+    print(f"\nFirst Item: {first_car}")
+    print(f"Last Item: {last_car}")
+
+    print(f"\nThe tuple contains {len(luxury_sedans)} luxury sedans.")
+
+    search_car = "Bentley Mulsanne"
+    if search_car in luxury_sedans:
+        print(f"Yes, '{search_car}' is in the tuple.")
+    else:
+        print(f"No, '{search_car}' is not in the tuple.")
+
+    temp_list = list(luxury_sedans)
+    temp_list.append("Aston Martin Rapide")
+    luxury_sedans = tuple(temp_list)
+
+    print("\nAfter adding a new item (via list conversion):")
+    print(luxury_sedans)
+
+    # The same add with a PVector: append() returns a new version and the old one is unchanged
+    sedans = PVector(("Rolls Royce Phantom", "Bentley Mulsanne", "Maybach S-class"))
+    more_sedans = sedans.append("Aston Martin Rapide")
+    print(f"\nPVector before append: {list(sedans)}")
+    print(f"PVector after append:  {list(more_sedans)}")
+    print(f"'{search_car}' in PVector: {search_car in more_sedans}, "
+          f"same items as the tuple: {more_sedans == PVector(luxury_sedans)}")
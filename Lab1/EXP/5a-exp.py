@@ -1,26 +1,58 @@
 #5a) Write a program to create a linked list and display its elements
+from array import array
 
 
 class Node:
+    # __slots__ drops the per-node __dict__, so each node only stores two references
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 class LinkedList:
-    def __init__(self):
+    def __init__(self, iterable=None):
         self.head = None
+        self.tail = None
+        self.size = 0
+        if iterable is not None:
+            self.extend(iterable)
 
     def append(self, data):
+        # O(1): link after the tail instead of walking from head every time
         new_node = Node(data)
-        
+
         if self.head is None:
-            self.head = new_node
-            return
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+        self.size += 1
+
+    def extend(self, iterable):
+        if iterable is self:
+            iterable = list(iterable)    # otherwise it would walk into the nodes it just added
+        tail = self.tail
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        self.tail = tail
+        self.size += count
 
-        last_node = self.head
-        while last_node.next:
-            last_node = last_node.next
-        last_node.next = new_node
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
 
     def display(self):
         current = self.head
@@ -34,11 +66,108 @@ class LinkedList:
             current = current.next
         print("None")
 
-my_list = LinkedList()
+class CompactLinkedList:
+    # Compact mode: nodes live in parallel arrays instead of separate objects.
+    #   data[i]  -> value of node i (typed array('d'), array('q'), ... or a plain list)
+    #   nxt[i]   -> index of the next node, -1 means None
+    # A node costs 8 bytes of link plus its value, instead of a full Python object.
+    def __init__(self, iterable=None, typecode=None):
+        self.data = array(typecode) if typecode else []
+        self.nxt = array("q")
+        self.head = -1
+        self.tail = -1
+        if iterable is not None:
+            self.extend(iterable)
+
+    def append(self, data):
+        index = len(self.nxt)
+        self.data.append(data)
+        self.nxt.append(-1)
+        if self.head == -1:
+            self.head = index
+        else:
+            self.nxt[self.tail] = index
+        self.tail = index
+
+    def extend(self, iterable):
+        if iterable is self:
+            iterable = list(iterable)
+        start = len(self.nxt)
+        self.data.extend(iterable)
+        end = len(self.data)
+        if end == start:
+            return
+        # new nodes are stored back to back, so node i links to i + 1
+        self.nxt.extend(range(start + 1, end + 1))
+        self.nxt[end - 1] = -1
+        if self.head == -1:
+            self.head = start
+        else:
+            self.nxt[self.tail] = start
+        self.tail = end - 1
+
+    def __len__(self):
+        return len(self.nxt)
+
+    def __iter__(self):
+        data = self.data
+        nxt = self.nxt
+        index = self.head
+        while index != -1:
+            yield data[index]
+            index = nxt[index]
+
+    def display(self):
+        if self.head == -1:
+            print("The list is empty.")
+            return
+
+        print("Linked List elements:")
+        for data in self:
+            print(data, end=" -> ")
+        print("None")
+
+# Benchmark: build time and memory per element for each list type.
+#   Run with:  python 5a-exp.py --bench [N]
+def benchmark(n=1_000_000):
+    import time
+    import tracemalloc
+
+    def measure(label, build):
+        # time without tracing (tracemalloc slows allocation down), then rebuild to measure memory
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        built = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(built) == n
+        print(f"{label:<32} {elapsed:8.2f} s {current / n:8.1f} bytes/element")
+
+    print(f"Building linked lists with {n:,} items")
+    measure("LinkedList.append", lambda: _append_all(LinkedList(), n))
+    measure("LinkedList.extend", lambda: LinkedList(range(n)))
+    measure("CompactLinkedList (list data)", lambda: CompactLinkedList(range(n)))
+    measure("CompactLinkedList (array 'q')", lambda: CompactLinkedList(range(n), typecode="q"))
+
+def _append_all(linked_list, n):
+    for i in range(n):
+        linked_list.append(i)
+    return linked_list
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
+        sys.exit()
+
+    my_list = LinkedList()
 
-my_list.append("Tesla Model S")
-my_list.append("Lucid Air")
-my_list.append("Porsche Taycan")
-my_list.append("Audi e-tron")
+    my_list.append("Tesla Model S")
+    my_list.append("Lucid Air")
+    my_list.append("Porsche Taycan")
+    my_list.append("Audi e-tron")
 
-my_list.display()
\ No newline at end of file
+    my_list.display()
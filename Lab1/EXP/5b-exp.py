@@ -1,14 +1,20 @@
-#5b)Write a program to demonstrate the implementation of a stack using a linked list (using push and pop 
+#5b)Write a program to demonstrate the implementation of a stack using a linked list (using push and pop
 #   functions)
+from array import array
 
 
+class StackUnderflow(IndexError):
+    pass
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
-class Stack:
+class LinkedStack:
+    # The original linked-list stack: one Node allocation per push.
     def __init__(self):
         self.top = None
 
@@ -19,7 +25,7 @@ class Stack:
 
     def pop(self):
         if self.top is None:
-            return "Stack Underflow"
+            raise StackUnderflow("Stack Underflow")
         popped_data = self.top.data
         self.top = self.top.next
         return popped_data
@@ -34,20 +40,116 @@ class Stack:
             current = current.next
         print("None")
 
-my_stack = Stack()
+class Stack:
+    # Contiguous stack: items live in one list (any object) or, with a typecode,
+    # in an array.array of raw numbers ('q' = 64-bit int, 'd' = float, ...).
+    # The top of the stack is the END of the storage, so push/pop are O(1).
+    def __init__(self, iterable=(), typecode=None):
+        self.items = array(typecode, iterable) if typecode else list(iterable)
+
+    def push(self, data):
+        self.items.append(data)
+
+    def push_many(self, iterable):
+        self.items.extend(iterable)
+
+    def pop(self):
+        if not self.items:
+            raise StackUnderflow("Stack Underflow")
+        return self.items.pop()
+
+    def pop_many(self, n):
+        # pops up to n items, returned in pop order (top first)
+        if n <= 0:
+            return self.items[:0]
+        popped = self.items[-n:]
+        del self.items[-n:]
+        popped.reverse()
+        return popped
+
+    def peek(self):
+        if not self.items:
+            raise StackUnderflow("Stack Underflow")
+        return self.items[-1]
+
+    def __len__(self):
+        return len(self.items)
+
+    def is_empty(self):
+        return not self.items
+
+    def display(self):
+        if not self.items:
+            print("Stack is empty")
+            return
+        for data in reversed(self.items):
+            print(data, end=" -> ")
+        print("None")
+
+# Benchmark: push/pop throughput and memory per element.
+#   Run with:  python 5b-exp.py --bench [N]
+def benchmark(n=1_000_000):
+    import time
+    import tracemalloc
+
+    def run(label, make, push_pop):
+        stack = make()
+        start = time.perf_counter()
+        push_pop(stack)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        stack = make()
+        for i in range(n):
+            stack.push(i)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<30} {2 * n / elapsed:14,.0f} ops/sec {current / n:8.1f} bytes/element")
+
+    def one_by_one(stack):
+        for i in range(n):
+            stack.push(i)
+        for _ in range(n):
+            stack.pop()
+
+    def batched(stack):
+        stack.push_many(range(n))
+        while len(stack):
+            stack.pop_many(1024)
+
+    print(f"Push + pop of {n:,} integers")
+    run("LinkedStack push/pop", LinkedStack, one_by_one)
+    run("Stack (list) push/pop", Stack, one_by_one)
+    run("Stack (array 'q') push/pop", lambda: Stack(typecode="q"), one_by_one)
+    run("Stack (list) batched", Stack, batched)
+    run("Stack (array 'q') batched", lambda: Stack(typecode="q"), batched)
+
+def pop_or_message(stack):
+    try:
+        return stack.pop()
+    except StackUnderflow as error:
+        return str(error)
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
+        sys.exit()
+
+    my_stack = Stack()
 
-my_stack.push("Pagani Huayra")
-my_stack.push("Koenigsegg Jesko")
-my_stack.push("Bugatti Chiron")
+    my_stack.push("Pagani Huayra")
+    my_stack.push("Koenigsegg Jesko")
+    my_stack.push("Bugatti Chiron")
 
-print("Current Stack:")
-my_stack.display()
+    print("Current Stack:")
+    my_stack.display()
 
-print("\nPopping element:", my_stack.pop())
-print("Popping element:", my_stack.pop())
+    print("\nPopping element:", pop_or_message(my_stack))
+    print("Popping element:", pop_or_message(my_stack))
 
-print("\nStack after pop operations:")
-my_stack.display()
+    print("\nStack after pop operations:")
+    my_stack.display()
 
-print("\nPopping element:", my_stack.pop())
-print("Popping element:", my_stack.pop())
\ No newline at end of file
+    print("\nPopping element:", pop_or_message(my_stack))
+    print("Popping element:", pop_or_message(my_stack))
@@ -1,13 +1,25 @@
-#5c)Write a program to demonstrate the implementation of a queue using a linked list (using the enqueue and 
+#5c)Write a program to demonstrate the implementation of a queue using a linked list (using the enqueue and
 #   dequeue functions)
+import asyncio
+import threading
+import time
 
 
+class QueueEmpty(Exception):
+    pass
+
+class QueueFull(Exception):
+    pass
+
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
-class Queue:
+class LinkedQueue:
+    # The original linked-list queue: one Node allocation per enqueue.
     def __init__(self):
         self.front = None
         self.rear = None
@@ -22,7 +34,7 @@ class Queue:
 
     def dequeue(self):
         if self.front is None:
-            return "Queue Underflow"
+            raise QueueEmpty("Queue Underflow")
         temp = self.front
         self.front = temp.next
         if self.front is None:
@@ -39,20 +51,247 @@ class Queue:
             current = current.next
         print("None")
 
-q = Queue()
+class Queue:
+    # Bounded ring buffer: a preallocated list of slots plus head/tail counters.
+    #   head -> number of items ever dequeued, tail -> number of items ever enqueued
+    #   slot of a counter = counter & mask  (capacity is rounded up to a power of two)
+    # No allocation per item, and a full queue pushes back with QueueFull.
+    def __init__(self, capacity=1024):
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.capacity = size
+        self.mask = size - 1
+        self.buffer = [None] * size
+        self.head = 0
+        self.tail = 0
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def is_empty(self):
+        return self.tail == self.head
+
+    def is_full(self):
+        return self.tail - self.head == self.capacity
+
+    def enqueue(self, data):
+        if self.tail - self.head == self.capacity:
+            raise QueueFull("Queue Overflow")
+        self.buffer[self.tail & self.mask] = data
+        self.tail += 1
+
+    def dequeue(self):
+        if self.tail == self.head:
+            raise QueueEmpty("Queue Underflow")
+        index = self.head & self.mask
+        data = self.buffer[index]
+        self.buffer[index] = None     # drop the reference so the item can be freed
+        self.head += 1
+        return data
+
+    def enqueue_many(self, items):
+        # all or nothing: either every item fits or QueueFull is raised and nothing is added
+        items = list(items)
+        count = len(items)
+        if count > self.capacity - (self.tail - self.head):
+            raise QueueFull("Queue Overflow")
+        start = self.tail & self.mask
+        first = min(count, self.capacity - start)   # slots before wrapping around
+        self.buffer[start:start + first] = items[:first]
+        self.buffer[:count - first] = items[first:]
+        self.tail += count
+
+    def dequeue_many(self, n):
+        # returns up to n items (fewer if the queue holds fewer)
+        count = min(n, self.tail - self.head)
+        start = self.head & self.mask
+        first = min(count, self.capacity - start)
+        items = self.buffer[start:start + first] + self.buffer[:count - first]
+        self.buffer[start:start + first] = [None] * first
+        self.buffer[:count - first] = [None] * (count - first)
+        self.head += count
+        return items
+
+    def display(self):
+        if self.is_empty():
+            print("Queue is empty")
+            return
+        for i in range(self.head, self.tail):
+            print(self.buffer[i & self.mask], end=" -> ")
+        print("None")
+
+class SPSCQueue(Queue):
+    # Single-producer / single-consumer queue for two threads.
+    # Only the producer moves tail and only the consumer moves head, and each
+    # counter update is a single atomic store under the GIL, so no lock is needed.
+    # A full/empty queue makes the caller back off (sleep) instead of spinning hot.
+    def enqueue(self, data, timeout=None):
+        if self.tail - self.head == self.capacity:
+            self._wait(lambda: self.tail - self.head < self.capacity, timeout, QueueFull("Queue Overflow"))
+        self.buffer[self.tail & self.mask] = data
+        self.tail += 1
+
+    def dequeue(self, timeout=None):
+        if self.tail == self.head:
+            self._wait(lambda: self.tail != self.head, timeout, QueueEmpty("Queue Underflow"))
+        index = self.head & self.mask
+        data = self.buffer[index]
+        self.buffer[index] = None
+        self.head += 1
+        return data
+
+    def enqueue_many(self, items, timeout=None):
+        items = list(items)
+        for start in range(0, len(items), self.capacity):
+            chunk = items[start:start + self.capacity]
+            if self.capacity - (self.tail - self.head) < len(chunk):
+                self._wait(lambda: self.capacity - (self.tail - self.head) >= len(chunk),
+                           timeout, QueueFull("Queue Overflow"))
+            Queue.enqueue_many(self, chunk)
+
+    def dequeue_many(self, n, timeout=None):
+        if self.tail == self.head:
+            self._wait(lambda: self.tail != self.head, timeout, QueueEmpty("Queue Underflow"))
+        return Queue.dequeue_many(self, n)
+
+    @staticmethod
+    def _wait(ready, timeout, error):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.0
+        while not ready():
+            if deadline is not None and time.monotonic() >= deadline:
+                raise error
+            time.sleep(delay)
+            delay = min(delay * 2 or 1e-6, 1e-3)
+
+class AsyncQueue(Queue):
+    # asyncio variant: await enqueue() waits while full, await dequeue() waits while empty.
+    def __init__(self, capacity=1024):
+        super().__init__(capacity)
+        self.not_full = asyncio.Event()
+        self.not_empty = asyncio.Event()
+        self.not_full.set()
+
+    async def enqueue(self, data):
+        while self.is_full():
+            self.not_full.clear()
+            await self.not_full.wait()
+        Queue.enqueue(self, data)
+        self.not_empty.set()
+
+    async def dequeue(self):
+        while self.is_empty():
+            self.not_empty.clear()
+            await self.not_empty.wait()
+        data = Queue.dequeue(self)
+        self.not_full.set()
+        return data
+
+    async def enqueue_many(self, items):
+        for data in items:
+            await self.enqueue(data)
+
+    async def dequeue_many(self, n):
+        while self.is_empty():
+            self.not_empty.clear()
+            await self.not_empty.wait()
+        items = Queue.dequeue_many(self, n)
+        self.not_full.set()
+        return items
+
+# Benchmark: events/sec through each queue.
+#   Run with:  python 5c-exp.py --bench [N]
+def benchmark(n=1_000_000):
+    def report(label, elapsed):
+        print(f"{label:<34} {n / elapsed:14,.0f} events/sec")
+
+    print(f"Pushing {n:,} events through each queue")
+    q = LinkedQueue()
+    start = time.perf_counter()
+    for i in range(n):
+        q.enqueue(i)
+    for i in range(n):
+        q.dequeue()
+    report("LinkedQueue enqueue/dequeue", time.perf_counter() - start)
+
+    q = Queue(n)
+    start = time.perf_counter()
+    for i in range(n):
+        q.enqueue(i)
+    for i in range(n):
+        q.dequeue()
+    report("Queue enqueue/dequeue", time.perf_counter() - start)
+
+    q = Queue(4096)
+    batch = list(range(1024))
+    start = time.perf_counter()
+    for _ in range(n // 1024):
+        q.enqueue_many(batch)
+        q.dequeue_many(1024)
+    report("Queue enqueue_many/dequeue_many", time.perf_counter() - start)
+
+    q = SPSCQueue(4096)
+    received = []
+
+    def consumer():
+        got = 0
+        while got < n:
+            got += len(q.dequeue_many(1024))
+        received.append(got)
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    for i in range(0, n, 1024):
+        q.enqueue_many(range(i, min(i + 1024, n)))
+    thread.join()
+    report("SPSCQueue 2 threads (batches)", time.perf_counter() - start)
+
+    async def run_async():
+        aq = AsyncQueue(4096)
+
+        async def produce():
+            for i in range(n):
+                await aq.enqueue(i)
+
+        async def consume():
+            for _ in range(n):
+                await aq.dequeue()
+
+        await asyncio.gather(produce(), consume())
+
+    start = time.perf_counter()
+    asyncio.run(run_async())
+    report("AsyncQueue producer/consumer", time.perf_counter() - start)
+
+def dequeue_or_message(queue):
+    try:
+        return queue.dequeue()
+    except QueueEmpty as error:
+        return str(error)
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
+        sys.exit()
+
+    q = Queue(capacity=8)
 
-q.enqueue("Range Rover")
-q.enqueue("G Wagon")
-q.enqueue("Urus")
+    q.enqueue("Range Rover")
+    q.enqueue("G Wagon")
+    q.enqueue("Urus")
 
-print("Queue after Enqueue:")
-q.display()
+    print("Queue after Enqueue:")
+    q.display()
 
-print("\nDequeued element:", q.dequeue())
-print("Dequeued element:", q.dequeue())
+    print("\nDequeued element:", dequeue_or_message(q))
+    print("Dequeued element:", dequeue_or_message(q))
 
-print("\nQueue after Dequeue:")
-q.display()
+    print("\nQueue after Dequeue:")
+    q.display()
 
-print("\nDequeued element:", q.dequeue())
-print("Dequeued element:", q.dequeue())
\ No newline at end of file
+    print("\nDequeued element:", dequeue_or_message(q))
+    print("Dequeued element:", dequeue_or_message(q))
@@ -1,10 +1,13 @@
 #6a)Writing and reading to a text file
+from file_stream import BatchWriter, iter_lines
 
 file_name = "data.txt"
 content = "Bugatti Chiron\nKoenigsegg Jesko"
 
-with open(file_name, "w") as f:
+with BatchWriter(file_name) as f:
     f.write(content)
 
-with open(file_name, "r") as f:
-    print(f.read())
\ No newline at end of file
+# iter_lines reads the file block by block, so this also works for multi-GB files
+for line in iter_lines(file_name):
+    print(line, end="")
+print()
@@ -10,4 +10,12 @@ with open("seek_demo.txt", "r") as f:
     print("Position after read:", f.tell())
     f.seek(0)
     print("Position after seek(0):", f.tell())
-    print("Re-reading from start:", f.read())
\ No newline at end of file
+    print("Re-reading from start:", f.read())
+
+# The same idea with mmap: the file is mapped once and any offset is read by slicing,
+# without a seek() + read() system call pair for each lookup.
+from mmap_reader import MappedFile
+
+with MappedFile("seek_demo.txt") as mf:
+    print("mmap bytes 0-6:", mf.read(0, 6).decode())
+    print("mmap bytes 7-11:", mf.read(7, 4).decode())
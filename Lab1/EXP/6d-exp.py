@@ -1,7 +1,14 @@
 #6d)To display data from a text file.
+from file_stream import read_chunks
+
 try:
-    with open("supercars.txt", "r") as file:
-        data = file.read()
-        print("File Content:", data)
+    # read the file one block at a time instead of loading it all with f.read()
+    chunks = read_chunks("supercars.txt", mode="r")
+    first_chunk = next(chunks, "")
 except FileNotFoundError:
-    print("Error: File does not exist.")
\ No newline at end of file
+    print("Error: File does not exist.")
+else:
+    print("File Content:", first_chunk, end="")
+    for chunk in chunks:
+        print(chunk, end="")
+    print()
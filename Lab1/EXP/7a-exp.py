@@ -1,9 +1,9 @@
 #7a)Pickling data in Python.
-import pickle
+import oob_pickle
 
 car_data = {"Model": "Phantom", "Brand": "Rolls-Royce", "Year": 2024}
 
-with open("car_obj.dat", "wb") as f:
-    pickle.dump(car_data, f)
+# protocol 5: large binary fields are written to car_obj.dat.buffers instead of being copied into the pickle
+oob_pickle.dump(car_data, "car_obj.dat")
 
-print("Data has been pickled.")
\ No newline at end of file
+print("Data has been pickled.")
@@ -1,9 +1,9 @@
 #7b)Unpickling data in Python.
-import pickle
+import oob_pickle
 
 try:
-    with open("car_obj.dat", "rb") as f:
-        loaded_data = pickle.load(f)
-        print("Unpickled Data:", loaded_data)
+    # large binary fields are mapped back from car_obj.dat.buffers without copying
+    loaded_data = oob_pickle.load("car_obj.dat")
+    print("Unpickled Data:", loaded_data)
 except FileNotFoundError:
-    print("Binary file not found.")
\ No newline at end of file
+    print("Binary file not found.")
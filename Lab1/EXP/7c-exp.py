@@ -1,20 +1,22 @@
 #7c)To perform basic operations on a binary file using pickle module
 
-import pickle
+from record_log import RecordLog
 
 def save_records():
     records = [
         {"ID": 1, "SUV": "Range Rover"},
         {"ID": 2, "SUV": "G-Wagon"}
     ]
-    with open("suv_records.dat", "wb") as f:
-        pickle.dump(records, f)
+    # each record is pickled and appended on its own, so adding one never rewrites the rest
+    with RecordLog("suv_records.dat", truncate=True) as log:
+        for record in records:
+            log.append(record)
 
 def read_records():
-    with open("suv_records.dat", "rb") as f:
-        data = pickle.load(f)
-        for item in data:
+    with RecordLog("suv_records.dat") as log:
+        for item in log.scan():
             print(f"Record: {item}")
+        print(f"Record at position 1 (read alone): {log.get(1)}")
 
 save_records()
-read_records()
\ No newline at end of file
+read_records()
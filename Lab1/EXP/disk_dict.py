@@ -0,0 +1,399 @@
+#Disk-backed dictionary for Experiment 4b.
+#   A dict keeps every key and value in RAM. DiskDict keeps them in two files instead, so the
+#   table can be much larger than memory while [], get(), update and len() work the same way:
+#
+#   "<path>"      value log, append-only. Every assignment appends one frame:
+#                     [4-byte key length][4-byte value length][pickled key][pickled value]
+#                 and every deletion a tombstone frame (value length TOMBSTONE, no value).
+#                 Old frames are never rewritten; an overwritten or deleted key leaves
+#                 garbage behind, which compact() removes. The log alone is enough to
+#                 rebuild a lost index.
+#   "<path>.idx"  open-addressing hash index (linear probing), memory-mapped:
+#                     header, then `capacity` slots of [8-byte key hash][frame offset + 1]
+#                 Offset 0 marks an empty slot and DELETED a deleted key.
+#
+#   A lookup hashes the key, walks the slots from hash & (capacity - 1), and reads the
+#   matching frame through an mmap of the log: a few slot reads and one frame read, without
+#   loading anything else. The index doubles when it is half full.
+#   Keys follow dict rules (1, 1.0 and True are the same key), but the hash has to be the
+#   same in every run, so keys must be str, bytes or numbers.
+import hashlib
+import mmap
+import os
+import numbers
+import pickle
+import struct
+from collections.abc import ItemsView, MutableMapping
+
+MAGIC = b"DISKDCT1"
+HEADER = struct.Struct("<8sQQQQ")    # magic, capacity, live keys, used slots, garbage bytes
+SLOT = struct.Struct("<QQ")          # key hash, frame offset + 1
+FRAME_HEADER = struct.Struct("<II")  # key length, value length
+DELETED = (1 << 64) - 1
+TOMBSTONE = (1 << 32) - 1            # value length of a deletion frame
+MIN_CAPACITY = 1024
+COMPACT_MIN_GARBAGE = 1 << 20        # auto compaction once garbage > 1 MB and > half the log
+SCAN_SLOTS = 1 << 16                 # slots read per step when scanning the whole index
+
+
+def _hash(key, key_bytes):
+    # a stable 64-bit hash that agrees with ==: Python's hash() of a str changes from run to
+    # run, so text is hashed with blake2b, while numeric hashes are fixed by the language and
+    # equal for equal numbers of any type
+    if type(key) not in (str, bytes):
+        if isinstance(key, numbers.Number):
+            return hash(key) & DELETED
+        if not isinstance(key, (str, bytes)):
+            raise TypeError(f"DiskDict keys must be str, bytes or numbers, not {type(key).__name__}")
+        key_bytes = pickle.dumps(str(key) if isinstance(key, str) else bytes(key), protocol=5)
+    return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), "little")
+
+def _create_index(path, capacity):
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, capacity, 0, 0, 0))
+        f.truncate(HEADER.size + capacity * SLOT.size)     # all-zero slots = empty
+
+def _capacity_for(count):
+    capacity = MIN_CAPACITY
+    while capacity < 2 * count:
+        capacity *= 2
+    return capacity
+
+class _DiskItemsView(ItemsView):
+    def __iter__(self):
+        return self._mapping._scan()
+
+class DiskDict(MutableMapping):
+    def __init__(self, path, index_path=None, truncate=False, auto_compact=True):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self.auto_compact = auto_compact
+        if truncate or not os.path.exists(self.index_path):
+            # a missing index is rebuilt from the log; only truncate=True empties the log
+            open(path, "wb" if truncate else "ab").close()
+            _create_index(self.index_path, MIN_CAPACITY)
+            self._open()
+            self._replay_log()
+        else:
+            self._open()
+
+    def _open(self):
+        # unbuffered appends: one write() per frame, so the reader below always sees it
+        self.log = open(self.path, "ab", buffering=0)
+        self.log_size = self.log.seek(0, os.SEEK_END)
+        self.reader = open(self.path, "rb")
+        self.log_map = b""
+        self._remap_log()
+        self.index_file = open(self.index_path, "r+b")
+        self.index = mmap.mmap(self.index_file.fileno(), 0)
+        magic, self.capacity, self.count, self.used, self.garbage = HEADER.unpack_from(self.index, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.index_path} is not a DiskDict index")
+        self.mask = self.capacity - 1
+
+    def _remap_log(self):
+        if isinstance(self.log_map, mmap.mmap):
+            self.log_map.close()
+        # mmap cannot map an empty file, so an empty bytes object stands in for it
+        self.log_map = mmap.mmap(self.reader.fileno(), 0, access=mmap.ACCESS_READ) if self.log_size else b""
+
+    def _read(self, offset, size):
+        end = offset + size
+        if end > len(self.log_map):
+            if self.log_size - len(self.log_map) < len(self.log_map) >> 3:
+                # written after the last remap: read it directly and remap only once the
+                # unmapped tail has grown, instead of remapping after every write
+                self.reader.seek(offset)
+                return self.reader.read(size)
+            self._remap_log()
+        return self.log_map[offset:end]
+
+    def _frame(self, offset):
+        # -> (key bytes, value bytes) of the frame at offset
+        key_size, value_size = FRAME_HEADER.unpack(self._read(offset, FRAME_HEADER.size))
+        body = self._read(offset + FRAME_HEADER.size, key_size + value_size)
+        return body[:key_size], body[key_size:]
+
+    def _find(self, key, key_bytes, h):
+        # -> (slot, frame offset, stored key bytes, value bytes); offset is -1 if the key is
+        # missing, and slot is then the empty slot where it would be stored
+        index = self.index
+        mask = self.mask
+        slot = h & mask
+        while True:
+            stored_hash, ref = SLOT.unpack_from(index, HEADER.size + slot * SLOT.size)
+            if ref == 0:
+                return slot, -1, None, None
+            if stored_hash == h and ref != DELETED:
+                frame_key, value_bytes = self._frame(ref - 1)
+                # equal pickles are equal keys; otherwise compare the keys themselves (1 == 1.0)
+                if frame_key == key_bytes or pickle.loads(frame_key) == key:
+                    return slot, ref - 1, frame_key, value_bytes
+            slot = (slot + 1) & mask
+
+    def _lookup(self, key):
+        key_bytes = pickle.dumps(key, protocol=5)
+        h = _hash(key, key_bytes)
+        return (h, key_bytes) + self._find(key, key_bytes, h)
+
+    def _write_header(self):
+        HEADER.pack_into(self.index, 0, MAGIC, self.capacity, self.count, self.used, self.garbage)
+
+    def __getitem__(self, key):
+        offset, _, value_bytes = self._lookup(key)[3:]
+        if offset < 0:
+            raise KeyError(key)
+        return pickle.loads(value_bytes)
+
+    def __contains__(self, key):
+        return self._lookup(key)[3] >= 0
+
+    def _put(self, slot, h, offset, old_key, old_value):
+        SLOT.pack_into(self.index, HEADER.size + slot * SLOT.size, h, offset + 1)
+        if old_key is not None:
+            self.garbage += FRAME_HEADER.size + len(old_key) + len(old_value)
+        else:
+            self.count += 1
+            self.used += 1
+
+    def _drop(self, slot, h, old_key, old_value, tombstone_size):
+        # the slot stays "used" so that probe chains running through it are not cut
+        SLOT.pack_into(self.index, HEADER.size + slot * SLOT.size, h, DELETED)
+        self.count -= 1
+        self.garbage += FRAME_HEADER.size + len(old_key) + len(old_value) + tombstone_size
+
+    def __setitem__(self, key, value):
+        h, key_bytes, slot, _, old_key, old_value = self._lookup(key)
+        if old_key is not None:
+            key_bytes = old_key          # like a dict, an existing key keeps its first form
+        value_bytes = pickle.dumps(value, protocol=5)
+        # the frame is written before the slot points at it, so a crash never indexes half a frame
+        offset = self.log_size
+        self._append(FRAME_HEADER.pack(len(key_bytes), len(value_bytes)) + key_bytes + value_bytes)
+        self._put(slot, h, offset, old_key, old_value)
+        self._write_header()
+        if 2 * self.used > self.capacity:
+            self._resize(2 * _capacity_for(self.count))
+        else:
+            self._maybe_compact()
+
+    def __delitem__(self, key):
+        h, _, slot, offset, old_key, old_value = self._lookup(key)
+        if offset < 0:
+            raise KeyError(key)
+        tombstone = FRAME_HEADER.pack(len(old_key), TOMBSTONE) + old_key
+        self._append(tombstone)
+        self._drop(slot, h, old_key, old_value, len(tombstone))
+        self._write_header()
+        self._maybe_compact()
+
+    def _append(self, frame):
+        # an unbuffered write() may take only part of the frame
+        view = memoryview(frame)
+        while view:
+            view = view[self.log.write(view):]
+        self.log_size += len(frame)
+
+    def _replay_log(self):
+        # rebuilds the (empty) index from the log: later frames win and tombstones delete. A
+        # frame cut short by a crash ends the log and is cut off.
+        offset = 0
+        while offset + FRAME_HEADER.size <= self.log_size:
+            key_size, value_size = FRAME_HEADER.unpack(self._read(offset, FRAME_HEADER.size))
+            frame_size = FRAME_HEADER.size + key_size + (0 if value_size == TOMBSTONE else value_size)
+            if offset + frame_size > self.log_size:
+                break
+            key_bytes = self._read(offset + FRAME_HEADER.size, key_size)
+            key = pickle.loads(key_bytes)
+            h = _hash(key, key_bytes)
+            slot, old_offset, old_key, old_value = self._find(key, key_bytes, h)
+            if value_size != TOMBSTONE:
+                self._put(slot, h, offset, old_key, old_value)
+                if 2 * self.used > self.capacity:
+                    self._resize(2 * _capacity_for(self.count))
+            elif old_offset >= 0:
+                self._drop(slot, h, old_key, old_value, frame_size)
+            else:
+                self.garbage += frame_size
+            offset += frame_size
+        if offset < self.log_size:
+            self.log.truncate(offset)
+            self.log_size = offset
+            self._remap_log()
+        self._write_header()
+
+    def __len__(self):
+        return self.count
+
+    def _live_slots(self):
+        # streams (hash, frame offset) of every live key, SCAN_SLOTS index slots at a time
+        for first in range(0, self.capacity, SCAN_SLOTS):
+            start = HEADER.size + first * SLOT.size
+            end = HEADER.size + min(first + SCAN_SLOTS, self.capacity) * SLOT.size
+            for h, ref in SLOT.iter_unpack(self.index[start:end]):
+                if ref and ref != DELETED:
+                    yield h, ref - 1
+
+    def _scan(self):
+        for _, offset in self._live_slots():
+            key_bytes, value_bytes = self._frame(offset)
+            yield pickle.loads(key_bytes), pickle.loads(value_bytes)
+
+    def __iter__(self):
+        for _, offset in self._live_slots():
+            yield pickle.loads(self._frame(offset)[0])
+
+    def items(self):
+        # streamed: one frame read per pair, never the whole table in memory
+        return _DiskItemsView(self)
+
+    def _build_index(self, path, capacity, entries):
+        # writes a fresh index at path from (hash, frame offset) pairs of distinct keys
+        _create_index(path, capacity)
+        mask = capacity - 1
+        count = 0
+        with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as index:
+            for h, offset in entries:
+                slot = h & mask
+                while SLOT.unpack_from(index, HEADER.size + slot * SLOT.size)[1]:
+                    slot = (slot + 1) & mask
+                SLOT.pack_into(index, HEADER.size + slot * SLOT.size, h, offset + 1)
+                count += 1
+            HEADER.pack_into(index, 0, MAGIC, capacity, count, count, 0)
+
+    def _resize(self, capacity):
+        # stored hashes are rehashed into a bigger table; the log is not read at all
+        self._build_index(self.index_path + ".tmp", capacity, self._live_slots())
+        garbage = self.garbage
+        self._close_files()
+        os.replace(self.index_path + ".tmp", self.index_path)
+        self._open()
+        self.garbage = garbage
+        self._write_header()
+
+    def _maybe_compact(self):
+        if self.auto_compact and self.garbage > COMPACT_MIN_GARBAGE and 2 * self.garbage > self.log_size:
+            self.compact()
+
+    def compact(self):
+        # rewrites the log with only the live frames and builds a matching index
+        log_tmp = self.path + ".tmp"
+
+        def copy_frames(out):
+            position = 0
+            for h, offset in self._live_slots():
+                key_bytes, value_bytes = self._frame(offset)
+                out.write(FRAME_HEADER.pack(len(key_bytes), len(value_bytes)) + key_bytes + value_bytes)
+                yield h, position
+                position += FRAME_HEADER.size + len(key_bytes) + len(value_bytes)
+
+        self._remap_log()
+        with open(log_tmp, "wb", buffering=1 << 20) as out:
+            self._build_index(self.index_path + ".tmp", _capacity_for(self.count), copy_frames(out))
+        self._close_files()
+        os.replace(log_tmp, self.path)
+        os.replace(self.index_path + ".tmp", self.index_path)
+        self._open()
+
+    def sync(self):
+        # forces the log and then the index to disk
+        os.fsync(self.log.fileno())
+        self.index.flush()
+
+    def _close_files(self):
+        self.index.close()
+        self.index_file.close()
+        if isinstance(self.log_map, mmap.mmap):
+            self.log_map.close()
+        self.reader.close()
+        self.log.close()
+
+    def close(self):
+        self._close_files()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# Benchmark: random get() latency and peak RSS of dict vs shelve vs DiskDict.
+#   Run with:  python disk_dict.py --bench [N]
+# Each reader runs in its own process so that peak RSS is measured separately. For DiskDict
+# the RSS includes mapped file pages, which are page cache the OS can drop under pressure.
+BRANDS = ("Land Rover", "Mercedes-Benz", "Rolls-Royce", "Lamborghini", "Bentley", "Porsche")
+
+def _measure(kind, path, n, lookups=100_000):
+    import random
+    import resource
+    import shelve
+    import sys
+    import time
+
+    keys = [f"model-{random.randrange(n)}" for _ in range(lookups)]
+    if kind == "dict":
+        table = {f"model-{i}": BRANDS[i % len(BRANDS)] for i in range(n)}
+    elif kind == "shelve":
+        table = shelve.open(path, "r")
+    else:
+        table = DiskDict(path)
+    start = time.perf_counter()
+    for key in keys:
+        table.get(key)
+    elapsed = (time.perf_counter() - start) / lookups
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_kb //= 1024      # macOS reports bytes
+    print(f"{kind:<10} get() {elapsed * 1e6:8.2f} us  peak RSS {peak_kb / 1024:8.1f} MB")
+    if kind != "dict":
+        table.close()
+
+def _build(kind, path, n):
+    import dbm
+    import shelve
+    import time
+
+    items = ((f"model-{i}", BRANDS[i % len(BRANDS)]) for i in range(n))
+    start = time.perf_counter()
+    if kind == "shelve":
+        with shelve.open(path, "n") as shelf:
+            shelf.update(items)
+        kind = f"shelve ({dbm.whichdb(path)})"
+    else:
+        with DiskDict(path, truncate=True) as table:
+            table.update(items)
+    print(f"build {kind:<20} {time.perf_counter() - start:8.3f} s for {n:,} keys")
+
+def benchmark(n=1_000_000, path="disk_dict_bench.db"):
+    import subprocess
+    import sys
+    import time
+
+    # builds run in child processes too: on Linux a child starts with its parent's RSS as peak
+    shelf_path = "disk_dict_bench.shelf"
+    try:
+        for kind, target in (("DiskDict", path), ("shelve", shelf_path)):
+            subprocess.run([sys.executable, __file__, "--build", kind, target, str(n)], check=True)
+        for kind, target in (("dict", ""), ("shelve", shelf_path), ("DiskDict", path)):
+            subprocess.run([sys.executable, __file__, "--measure", kind, target, str(n)], check=True)
+        with DiskDict(path) as table:
+            for i in range(0, n, 2):
+                table[f"model-{i}"] = "Lamborghini (Performance Division)"   # leaves garbage
+            size = table.log_size
+            start = time.perf_counter()
+            table.compact()
+            print(f"{'compact':<16} {time.perf_counter() - start:8.3f} s, log {size >> 20} MB -> {table.log_size >> 20} MB")
+    finally:
+        for name in os.listdir("."):
+            if name.startswith(("disk_dict_bench.db", shelf_path)):
+                os.remove(name)
+
+if __name__ == "__main__":
+    import sys
+    if "--measure" in sys.argv:
+        _measure(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    elif "--build" in sys.argv:
+        _build(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    elif "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
@@ -0,0 +1,129 @@
+#Streaming file helpers for Experiment 6: read and write big files without loading them into memory.
+#   read_chunks()  -> yields fixed-size blocks of the file
+#   iter_lines()   -> yields lines, even when a line is split across two blocks
+#   BatchWriter    -> collects many small writes and sends them to the OS in large blocks
+import os
+import sys
+import time
+
+CHUNK_SIZE = 1 << 20       # 1 MB
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE, mode="rb", encoding=None):
+    with open(path, mode, encoding=encoding) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def iter_lines(path, chunk_size=CHUNK_SIZE, encoding="utf-8", keepends=True):
+    # Read binary blocks and cut them at b"\n". The piece after the last newline
+    # is an incomplete line, so it is carried over and joined with the next block.
+    leftover = b""
+    for chunk in read_chunks(path, chunk_size):
+        lines = (leftover + chunk).split(b"\n")
+        leftover = lines.pop()
+        for line in lines:
+            if keepends:
+                line += b"\n"
+            yield line.decode(encoding) if encoding else line
+    if leftover:
+        yield leftover.decode(encoding) if encoding else leftover
+
+class BatchWriter:
+    # Small writes are appended to a list; once buffer_size bytes are waiting they are
+    # joined and written with ONE write() call on an unbuffered file. The file is opened in
+    # binary mode (str is encoded here), because text files cannot be unbuffered.
+    def __init__(self, path, buffer_size=CHUNK_SIZE, mode="wb", encoding="utf-8"):
+        if "b" not in mode or "t" in mode:
+            raise ValueError(f"BatchWriter needs a binary mode such as 'wb' or 'ab', got {mode!r}")
+        self.file = open(path, mode, buffering=0)
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self.pending = []
+        self.pending_size = 0
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode(self.encoding)
+        self.pending.append(data)
+        self.pending_size += len(data)
+        if self.pending_size >= self.buffer_size:
+            self.flush()
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        if self.pending:
+            # an unbuffered write() may accept only part of the block: write the rest too
+            view = memoryview(b"".join(self.pending))
+            while view:
+                view = view[self.file.write(view):]
+            self.pending = []
+            self.pending_size = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# Benchmark on a synthetic file: MB/s and peak RSS of read-all vs streaming.
+#   Run with:  python file_stream.py --bench [size_in_MB]
+# Every reader runs in its own process so that peak RSS is measured separately.
+def _make_synthetic_file(path, size_mb):
+    line = b"2024-01-01T00:00:00 INFO Bugatti Chiron telemetry sample ok\n"
+    count = size_mb * (1 << 20) // len(line)
+    with BatchWriter(path) as w:
+        for _ in range(count):
+            w.write(line)
+
+def _measure(kind, path):
+    import resource
+
+    start = time.perf_counter()
+    if kind == "read-all":
+        with open(path, "r") as f:
+            data = f.read()
+        total = len(data)
+    elif kind == "read-all-lines":
+        with open(path, "r") as f:
+            total = sum(len(line) for line in f.read().splitlines(True))
+    elif kind == "read_chunks":
+        total = sum(len(chunk) for chunk in read_chunks(path))
+    elif kind == "iter_lines":
+        total = sum(len(line) for line in iter_lines(path, encoding=None))
+    else:
+        raise ValueError(f"unknown reader: {kind}")
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_kb //= 1024      # macOS reports bytes
+    print(f"{kind:<16} {total / (1 << 20) / elapsed:10.1f} MB/s  peak RSS {peak_kb / 1024:8.1f} MB")
+
+def benchmark(size_mb=1024, path="stream_bench.txt"):
+    import subprocess
+
+    print(f"Writing {size_mb} MB synthetic file with BatchWriter...")
+    start = time.perf_counter()
+    _make_synthetic_file(path, size_mb)
+    print(f"{'BatchWriter':<16} {size_mb / (time.perf_counter() - start):10.1f} MB/s")
+    try:
+        for kind in ("read-all", "read-all-lines", "read_chunks", "iter_lines"):
+            subprocess.run([sys.executable, __file__, "--measure", kind, path], check=True)
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    if "--measure" in sys.argv:
+        _measure(sys.argv[2], sys.argv[3])
+    elif "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1024)
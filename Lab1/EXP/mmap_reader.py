@@ -0,0 +1,167 @@
+#Memory-mapped random access, building on the seek()/tell() demo in 6b.
+#   With seek()+read() every lookup is two system calls and a copy into a new bytes object.
+#   With mmap the file is mapped into memory once; a lookup is just slicing, and a
+#   memoryview slice does not copy any data at all.
+#
+#   MappedFile(path).view(offset, length) -> memoryview over the file bytes (zero-copy)
+#   MappedFile(path).line(i)              -> line i (without "\n") in O(1) using a line index
+#
+#   The line index is built once and saved next to the file as "<path>.idx", so later
+#   runs load it directly. It is rebuilt automatically if the file size or mtime changed, or
+#   if the saved index is cut short or damaged. It is written to a temporary file and renamed
+#   into place, so a crash or a second process never leaves half an index behind.
+import mmap
+import os
+from array import array
+
+
+class MappedFile:
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self.file = open(path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        # mmap cannot map an empty file, so an empty bytes object stands in for it
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.buffer = memoryview(self.mm)
+        self.offsets = None
+
+    def view(self, offset, length):
+        return self.buffer[offset:offset + length]
+
+    def read(self, offset, length):
+        return bytes(self.view(offset, length))
+
+    def line_offsets(self):
+        # offsets[i] is where line i starts; line i ends one byte before offsets[i + 1]
+        if self.offsets is None:
+            self.offsets = self._load_index()
+            if self.offsets is None:
+                self.offsets = self._build_index()
+                try:
+                    self._save_index(self.offsets)
+                except OSError:
+                    pass    # e.g. a read-only folder: the index is only a cache, keep it in memory
+        return self.offsets
+
+    def line_count(self):
+        return len(self.line_offsets()) - 1
+
+    def line(self, i):
+        offsets = self.line_offsets()
+        if not 0 <= i < len(offsets) - 1:
+            raise IndexError("line index out of range")
+        return self.buffer[offsets[i]:offsets[i + 1] - 1]
+
+    def _build_index(self):
+        offsets = array("q", [0])
+        find = self.mm.find
+        pos = find(b"\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = find(b"\n", pos + 1)
+        if offsets[-1] != self.size:
+            offsets.append(self.size + 1)    # last line has no "\n"
+        return offsets
+
+    def _stamp(self):
+        stat = os.stat(self.path)
+        return array("q", [stat.st_size, stat.st_mtime_ns])
+
+    def _save_index(self, offsets):
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                self._stamp().tofile(f)
+                offsets.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _load_index(self):
+        # -> the saved offsets, or None when they are missing or stale and must be rebuilt
+        data = array("q")
+        try:
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        if len(raw) % data.itemsize:
+            return None                 # cut off in the middle of an entry
+        data.frombytes(raw)
+        if len(data) < 3 or data[:2] != self._stamp():
+            return None
+        offsets = data[2:]
+        if offsets[0] != 0 or offsets[-1] not in (self.size, self.size + 1):
+            return None                 # a short index: it does not reach the end of the file
+        return offsets
+
+    def close(self):
+        # every memoryview returned by view()/line() must be released before this
+        self.buffer.release()
+        if self.size:
+            self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# Benchmark: 10^6 random reads with seek()+read() vs mmap views.
+#   Run with:  python mmap_reader.py --bench [lookups]
+def benchmark(lookups=1_000_000, lines=1_000_000, path="mmap_bench.txt"):
+    import random
+    import time
+
+    with open(path, "w") as f:
+        for i in range(lines):
+            f.write(f"record {i:08d} Lamborghini Revuelto V12 hybrid\n")
+    size = os.path.getsize(path)
+    offsets = [random.randrange(0, size - 64) for _ in range(lookups)]
+    line_numbers = [random.randrange(lines) for _ in range(lookups)]
+
+    def report(label, elapsed):
+        print(f"{label:<28} {elapsed:8.3f} s {lookups / elapsed:14,.0f} lookups/sec")
+
+    try:
+        print(f"{lookups:,} random lookups in a {size / (1 << 20):.1f} MB file")
+        with open(path, "rb") as f:
+            start = time.perf_counter()
+            for offset in offsets:
+                f.seek(offset)
+                f.read(64)
+            report("seek + read(64)", time.perf_counter() - start)
+
+        with MappedFile(path) as mf:
+            start = time.perf_counter()
+            view = mf.view
+            for offset in offsets:
+                view(offset, 64).release()
+            report("mmap view(offset, 64)", time.perf_counter() - start)
+
+            start = time.perf_counter()
+            mf.line_offsets()
+            print(f"{'build + save line index':<28} {time.perf_counter() - start:8.3f} s")
+            start = time.perf_counter()
+            line = mf.line
+            for i in line_numbers:
+                line(i).release()
+            report("mmap line(i)", time.perf_counter() - start)
+
+        with MappedFile(path) as mf:
+            start = time.perf_counter()
+            mf.line_offsets()
+            print(f"{'load saved line index':<28} {time.perf_counter() - start:8.3f} s")
+    finally:
+        os.remove(path)
+        os.remove(path + ".idx")
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
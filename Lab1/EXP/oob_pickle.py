@@ -0,0 +1,157 @@
+#Out-of-band pickling (protocol 5) for Experiments 7a and 7b.
+#   A normal pickle.dump() copies every large bytes/array field INTO the pickle stream, and
+#   pickle.load() copies it OUT again. With protocol 5 large buffers can travel "out-of-band":
+#   pickle only writes a placeholder and hands the raw buffer to us.
+#
+#   dump(obj, path): the pickle stream goes to <path>, the raw buffers go to <path>.buffers
+#   load(path):      <path>.buffers is mapped with mmap and each buffer is given back to pickle
+#                    as a memoryview slice, so nothing is copied or even read until it is used.
+#
+#   Large bytes / bytearray / array.array values come back as read-only memoryviews over the
+#   mapped file (arrays keep their typecode through memoryview.cast). NumPy arrays support
+#   protocol 5 natively and come back as arrays backed by the mapped file. Everything else,
+#   including subclasses, namedtuples, shared references and cycles, is pickled as usual.
+#
+#   <path> starts with MAGIC; a file without it is a plain pickle (e.g. written by pickle.dump
+#   before this module existed) and is loaded with pickle.load.
+import io
+import mmap
+import os
+import pickle
+import struct
+from array import array
+
+OOB_THRESHOLD = 1 << 16     # fields smaller than 64 KB stay in the pickle stream
+ALIGNMENT = 64              # buffers start on 64-byte boundaries in the sidecar file
+MAGIC = b"OOBPKL1\n"
+COUNT = struct.Struct("<Q")
+ENTRY = struct.Struct("<QQ")    # (offset, length) of one buffer in the sidecar file
+
+
+def _restore(buffer, typecode):
+    view = memoryview(buffer)
+    return view if typecode == "B" else view.cast(typecode)
+
+class _Pickler(pickle.Pickler):
+    # Large binary fields are replaced by a persistent id and written to the sidecar file.
+    # persistent_id() is the hook for this rather than reducer_override(): the C pickler
+    # calls it for every object, while exact bytes and bytearray never reach reducer_override.
+    def __init__(self, file, sidecar, threshold):
+        super().__init__(file, protocol=5)
+        self.sidecar = sidecar
+        self.threshold = threshold
+        self.entries = []
+        self.offset = 0
+        self.stored = {}        # id(field) -> (field, persistent id): a shared field is stored once
+
+    def persistent_id(self, obj):
+        if type(obj) not in (bytes, bytearray, array):
+            return None         # subclasses keep their type, so they stay in the stream
+        stored = self.stored.get(id(obj))
+        if stored is not None:
+            return stored[1]
+        raw = pickle.PickleBuffer(obj).raw()
+        if raw.nbytes < self.threshold:
+            return None
+        padding = -self.offset % ALIGNMENT
+        self.sidecar.write(b"\0" * padding)
+        self.offset += padding
+        self.sidecar.write(raw)     # written straight from the original object, no copy
+        pid = (len(self.entries), obj.typecode if isinstance(obj, array) else "B")
+        self.entries.append(ENTRY.pack(self.offset, raw.nbytes))
+        self.offset += raw.nbytes
+        self.stored[id(obj)] = (obj, pid)
+        return pid
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, buffers):
+        super().__init__(file)
+        self.buffers = buffers
+        self.restored = {}
+
+    def persistent_load(self, pid):
+        index, typecode = pid
+        if index not in self.restored:
+            self.restored[index] = _restore(self.buffers[index], typecode)
+        return self.restored[index]
+
+def dump(obj, path, threshold=OOB_THRESHOLD):
+    data = io.BytesIO()
+    with open(path + ".buffers", "wb") as sidecar:
+        pickler = _Pickler(data, sidecar, threshold)
+        pickler.dump(obj)
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(COUNT.pack(len(pickler.entries)))
+        f.write(b"".join(pickler.entries))
+        f.write(data.getbuffer())
+
+def load(path):
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            f.seek(0)
+            return pickle.load(f)
+        (count,) = COUNT.unpack(f.read(COUNT.size))
+        entries = [ENTRY.unpack(f.read(ENTRY.size)) for _ in range(count)]
+        data = f.read()
+    buffers = []
+    if count:
+        with open(path + ".buffers", "rb") as f:
+            # the map stays alive as long as any returned view still points into it
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        buffers = [view[offset:offset + length] for offset, length in entries]
+    return _Unpickler(io.BytesIO(data), buffers).load()
+
+# Benchmark: dump/load time and peak RSS for a large payload, plain pickle vs out-of-band.
+#   Run with:  python oob_pickle.py --bench [size_in_MB]
+# Each step runs in its own process so that peak RSS is measured separately.
+def _measure(step, path, size_mb):
+    import resource
+    import sys
+    import time
+
+    if step.startswith("dump"):
+        payload = {"Model": "Phantom", "Brand": "Rolls-Royce", "Year": 2024,
+                   "Telemetry": b"\xab" * (size_mb << 20)}
+        start = time.perf_counter()
+        if step == "dump-plain":
+            with open(path, "wb") as f:
+                pickle.dump(payload, f)
+        else:
+            dump(payload, path)
+    else:
+        start = time.perf_counter()
+        if step == "load-plain":
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+        else:
+            payload = load(path)
+        assert len(payload["Telemetry"]) == size_mb << 20
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_kb //= 1024
+    print(f"{step:<10} {elapsed:8.3f} s  peak RSS {peak_kb / 1024:8.1f} MB")
+
+def benchmark(size_mb=1024):
+    import subprocess
+    import sys
+
+    print(f"Pickling a record with a {size_mb} MB binary field")
+    try:
+        for step, path in (("dump-plain", "oob_bench_plain.dat"), ("load-plain", "oob_bench_plain.dat"),
+                           ("dump-oob", "oob_bench.dat"), ("load-oob", "oob_bench.dat")):
+            subprocess.run([sys.executable, __file__, "--measure", step, path, str(size_mb)], check=True)
+    finally:
+        for name in ("oob_bench_plain.dat", "oob_bench.dat", "oob_bench.dat.buffers"):
+            if os.path.exists(name):
+                os.remove(name)
+
+if __name__ == "__main__":
+    import sys
+    if "--measure" in sys.argv:
+        _measure(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    elif "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1024)
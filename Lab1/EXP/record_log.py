@@ -0,0 +1,161 @@
+#Append-only record log for Experiment 7c.
+#   Instead of pickling the whole list in one pickle.dump(), every record is pickled on its own
+#   (protocol 5) and appended to the data file as a frame:
+#       [8-byte length][pickled record]
+#   A side index file "<path>.idx" stores one 8-byte offset per record, so record id i lives at
+#   byte i * 8 of the index. get(i) reads one offset and one frame: constant time and memory,
+#   however many records the log holds. Adding a record never rewrites the old ones.
+#   A crash can leave a torn tail: part of an index entry, or frames written after the last
+#   entry. Opening the log cuts both off, so get() and scan() always see the same records.
+import os
+import pickle
+import struct
+
+FRAME_HEADER = struct.Struct("<Q")     # length of the pickled record
+INDEX_ENTRY = struct.Struct("<Q")      # offset of the frame in the data file
+
+
+class RecordLog:
+    def __init__(self, path, index_path=None, truncate=False):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        mode = "w+b" if truncate else "a+b"
+        self.data = open(path, mode)
+        self.index = open(self.index_path, mode)
+        if not truncate:
+            self._recover()
+
+    def _recover(self):
+        # keep whole index entries whose frame is complete, and no data after the last of them
+        data_size = os.fstat(self.data.fileno()).st_size
+        count = len(self)
+        end = 0
+        while count:
+            self.index.seek((count - 1) * INDEX_ENTRY.size)
+            (offset,) = INDEX_ENTRY.unpack(self.index.read(INDEX_ENTRY.size))
+            self.data.seek(offset)
+            header = self.data.read(FRAME_HEADER.size)
+            if len(header) == FRAME_HEADER.size:
+                end = offset + FRAME_HEADER.size + FRAME_HEADER.unpack(header)[0]
+                if end <= data_size:
+                    break
+            count -= 1
+            end = 0
+        self.index.truncate(count * INDEX_ENTRY.size)
+        self.data.truncate(end)
+
+    def __len__(self):
+        return os.fstat(self.index.fileno()).st_size // INDEX_ENTRY.size
+
+    def append(self, record):
+        # returns the id of the new record
+        payload = pickle.dumps(record, protocol=5)
+        self.data.seek(0, os.SEEK_END)
+        offset = self.data.tell()
+        self.data.write(FRAME_HEADER.pack(len(payload)) + payload)
+        self.data.flush()
+        # the frame is written before its index entry, so a crash never indexes half a record
+        self.index.seek(0, os.SEEK_END)
+        record_id = self.index.tell() // INDEX_ENTRY.size
+        self.index.write(INDEX_ENTRY.pack(offset))
+        self.index.flush()
+        return record_id
+
+    def extend(self, records):
+        # batch version of append(): one write per file for the whole batch
+        self.data.seek(0, os.SEEK_END)
+        offset = self.data.tell()
+        frames = []
+        entries = []
+        for record in records:
+            payload = pickle.dumps(record, protocol=5)
+            frames.append(FRAME_HEADER.pack(len(payload)))
+            frames.append(payload)
+            entries.append(INDEX_ENTRY.pack(offset))
+            offset += FRAME_HEADER.size + len(payload)
+        self.data.write(b"".join(frames))
+        self.data.flush()
+        self.index.seek(0, os.SEEK_END)
+        self.index.write(b"".join(entries))
+        self.index.flush()
+
+    def get(self, record_id):
+        if not 0 <= record_id < len(self):
+            raise IndexError("record id out of range")
+        self.index.seek(record_id * INDEX_ENTRY.size)
+        (offset,) = INDEX_ENTRY.unpack(self.index.read(INDEX_ENTRY.size))
+        self.data.seek(offset)
+        (length,) = FRAME_HEADER.unpack(self.data.read(FRAME_HEADER.size))
+        return pickle.loads(self.data.read(length))
+
+    def scan(self):
+        # streams every record from the start of the data file, one frame at a time
+        self.data.flush()
+        with open(self.path, "rb") as f:
+            while True:
+                header = f.read(FRAME_HEADER.size)
+                if len(header) < FRAME_HEADER.size:
+                    break
+                (length,) = FRAME_HEADER.unpack(header)
+                yield pickle.loads(f.read(length))
+
+    def close(self):
+        self.data.close()
+        self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# Benchmark: build a log, then time single-record reads against one big pickle.load().
+#   Run with:  python record_log.py --bench [N]
+def benchmark(n=1_000_000, path="record_bench.dat"):
+    import random
+    import time
+    import tracemalloc
+
+    records = ({"ID": i, "SUV": "Range Rover", "Year": 2024} for i in range(n))
+    start = time.perf_counter()
+    with RecordLog(path, truncate=True) as log:
+        log.extend(records)
+    print(f"{'write log':<26} {time.perf_counter() - start:8.3f} s for {n:,} records")
+
+    with open("record_bench_list.dat", "wb") as f:
+        pickle.dump([{"ID": i, "SUV": "Range Rover", "Year": 2024} for i in range(n)], f)
+
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        with open("record_bench_list.dat", "rb") as f:
+            record = pickle.load(f)[n // 2]
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{'pickle.load whole list':<26} {elapsed * 1e6:12.1f} us  peak {peak / (1 << 20):8.2f} MB")
+
+        with RecordLog(path) as log:
+            ids = [random.randrange(n) for _ in range(10_000)]
+            tracemalloc.start()
+            start = time.perf_counter()
+            for record_id in ids:
+                log.get(record_id)
+            elapsed = (time.perf_counter() - start) / len(ids)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{'RecordLog.get (avg)':<26} {elapsed * 1e6:12.1f} us  peak {peak / (1 << 20):8.2f} MB")
+            assert log.get(n // 2) == record
+
+            start = time.perf_counter()
+            count = sum(1 for _ in log.scan())
+            print(f"{'RecordLog.scan':<26} {time.perf_counter() - start:8.3f} s for {count:,} records")
+    finally:
+        for name in (path, path + ".idx", "record_bench_list.dat"):
+            os.remove(name)
+
+if __name__ == "__main__":
+    import sys
+    if "--bench" in sys.argv:
+        args = [a for a in sys.argv[1:] if a != "--bench"]
+        benchmark(int(args[0]) if args else 1_000_000)
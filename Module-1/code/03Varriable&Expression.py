@@ -146,58 +146,498 @@ message = f"Hello {name}, radius {radius} => area {area:.2f}"
 import sqlite3
 import json  # for storing complex objects as JSON strings (optional)
 
+# -----------------------------
+# 9b) Writing MANY snapshots fast (batching, transactions, WAL, indexes)
+# -----------------------------
+# One cur.execute() INSERT per value plus a commit costs a round trip into SQLite and a
+# journal sync each time. For hundreds of thousands of rows:
+#   - executemany() sends a whole batch through ONE prepared statement
+#   - wrapping the batch in ONE transaction means ONE journal sync instead of one per row
+#   - WAL journal mode lets readers keep reading while a writer appends
+#   - synchronous=NORMAL is safe with WAL and skips an fsync per commit
+#   - cache_size < 0 is in KiB: -65536 keeps up to 64 MB of pages in memory
+#   - an index on (name, created_at) turns "history of one variable" into an index range scan
+# Reads iterate the cursor inside a generator, so a million rows never sit in one big
+# fetchall() list.
+SNAPSHOT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Typed columns instead of "everything is TEXT + a type string":
+#   ints/bools -> value_int (INTEGER), floats -> value_real (REAL), str -> value_text,
+#   bytes -> value_blob, dicts/lists -> value_blob as msgpack when it is installed and the
+#   value survives a round trip, otherwise "tjson" text (tagged JSON, see below); tuples -> tjson.
+# SQLite hands INTEGER/REAL columns back as Python int/float directly, so reading those rows
+# needs no int()/float() parsing. Each type tag is registered ONCE in a dispatch table
+# (tag -> column + optional decoder), replacing the if/elif chain on every row.
+# An encoder that cannot store a value raises, and the value goes to its fallback tag:
+# ints outside SQLite's 64-bit range and NaN are kept as text, msgpack misses go to tjson.
+# Every format here is data only: reading a database never runs code stored in it (so no
+# pickle), and the formats are stable across Python versions (so no marshal).
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+import base64
+from functools import partial
+
+SNAPSHOT_COLUMNS = ("value_int", "value_real", "value_text", "value_blob")
+_SNAPSHOT_ENCODERS = {}   # python type -> (tag, column index, encode function or None, fallback tag)
+_SNAPSHOT_DECODERS = {}   # tag -> (column index, decode function or None)
+_SNAPSHOT_CODECS = {}     # tag -> (column index, encode function or None), for fallbacks
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+def register_snapshot_type(tag, py_type, column, encode=None, decode=None, fallback=None):
+    column_index = SNAPSHOT_COLUMNS.index(column)
+    if py_type is not None:
+        _SNAPSHOT_ENCODERS[py_type] = (tag, column_index, encode, fallback)
+    _SNAPSHOT_DECODERS[tag] = (column_index, decode)
+    _SNAPSHOT_CODECS[tag] = (column_index, encode)
+
+def _int64(value):
+    if not INT64_MIN <= value <= INT64_MAX:
+        raise OverflowError("int does not fit in SQLite INTEGER")
+    return value
+
+def _real(value):
+    if value != value:
+        raise ValueError("SQLite stores NaN as NULL")
+    return value
+
+register_snapshot_type("int", int, "value_int", encode=_int64, fallback="int_text")
+register_snapshot_type("int_text", None, "value_text", encode=str, decode=int)
+register_snapshot_type("bool", bool, "value_int", decode=bool)
+register_snapshot_type("float", float, "value_real", encode=_real, fallback="float_text")
+register_snapshot_type("float_text", None, "value_text", encode=repr, decode=float)
+register_snapshot_type("str", str, "value_text")
+register_snapshot_type("bytes", bytes, "value_blob")
+
+# tjson: plain JSON keeps str/int/float/bool/None/list as they are, and wraps the types JSON
+# would lose in a one-key object: {"d": [[key, value], ...]} for every dict (keys of any type),
+# {"t": [...]} for tuples and {"b": "<base64>"} for bytes. Since every real dict is wrapped,
+# a one-key object is never ambiguous. Anything else (sets, functions, ...) raises TypeError.
+def _tjson_tree(value):
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_tjson_tree(item) for item in value]
+    if isinstance(value, tuple):
+        return {"t": [_tjson_tree(item) for item in value]}
+    if isinstance(value, dict):
+        return {"d": [[_tjson_tree(k), _tjson_tree(v)] for k, v in value.items()]}
+    if isinstance(value, bytes):
+        return {"b": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"cannot store {type(value).__name__} in a snapshot")
+
+def _tjson_object(obj):
+    # object_hook: turns each wrapped object back into its Python value, innermost first
+    (kind, payload), = obj.items()
+    if kind == "d":
+        return {k: v for k, v in payload}   # tuple/bytes keys were already rebuilt
+    if kind == "t":
+        return tuple(payload)
+    if kind == "b":
+        return base64.b64decode(payload)
+    raise ValueError(f"unknown tjson tag {kind!r}")
+
+def _tjson_dumps(value):
+    return json.dumps(_tjson_tree(value), separators=(",", ":"))
+
+_tjson_loads = partial(json.loads, object_hook=_tjson_object)
+
+register_snapshot_type("tjson", tuple, "value_text", encode=_tjson_dumps, decode=_tjson_loads)
+# "json" rows come from the original TEXT-only layout and can still be read
+register_snapshot_type("json", None, "value_text", decode=json.loads)
+if msgpack is not None:
+    # strict_map_key=False: int keys ({1: "a"}) are valid dict keys and must read back
+    _msgpack_loads = partial(msgpack.unpackb, strict_map_key=False)
+
+    def _msgpack_dumps(value):
+        packed = msgpack.packb(value)
+        if _msgpack_loads(packed) != value:    # e.g. tuples would come back as lists
+            raise ValueError("value does not survive a msgpack round trip")
+        return packed
+
+    for container in (dict, list):
+        register_snapshot_type("msgpack", container, "value_blob", encode=_msgpack_dumps,
+                               decode=_msgpack_loads, fallback="tjson")
+else:
+    for container in (dict, list):
+        _SNAPSHOT_ENCODERS[container] = _SNAPSHOT_ENCODERS[tuple]
+
+def encode_value(value):
+    # -> (tag, value_int, value_real, value_text, value_blob) with only one column filled
+    # exact type lookup first (fast, and keeps bool apart from int), then parent classes
+    entry = _SNAPSHOT_ENCODERS.get(type(value))
+    if entry is None:
+        entry = next((_SNAPSHOT_ENCODERS[t] for t in type(value).__mro__ if t in _SNAPSHOT_ENCODERS),
+                     _SNAPSHOT_ENCODERS[str])
+    tag, column_index, encode, fallback = entry
+    if encode is not None:
+        try:
+            value = encode(value)
+        except (TypeError, ValueError, OverflowError):
+            if fallback is None:
+                raise
+            tag = fallback
+            column_index, encode = _SNAPSHOT_CODECS[tag]
+            value = encode(value)
+    elif tag == "str":
+        value = str(value)
+    row = [tag, None, None, None, None]
+    row[1 + column_index] = value
+    return row
+
+class SnapshotStore:
+    def __init__(self, path="variables_demo.db", timeout=30.0, check_same_thread=True):
+        # timeout: how long to wait for another connection's write lock before "database is locked"
+        self.conn = sqlite3.connect(path, timeout=timeout, check_same_thread=check_same_thread)
+        for pragma in SNAPSHOT_PRAGMAS:
+            self.conn.execute(pragma)
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            value_type TEXT,
+            value_int INTEGER,
+            value_real REAL,
+            value_text TEXT,
+            value_blob BLOB,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        self._upgrade_text_layout()
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_name_created "
+                          "ON snapshots (name, created_at)")
+        self.conn.commit()
+
+    def _upgrade_text_layout(self):
+        # databases written before the typed columns only have value_text + value_type
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(snapshots)")}
+        missing = [c for c in ("value_int", "value_real", "value_blob") if c not in columns]
+        if not missing:
+            return
+        with self.conn:
+            for column in missing:
+                kind = {"value_int": "INTEGER", "value_real": "REAL", "value_blob": "BLOB"}[column]
+                self.conn.execute(f"ALTER TABLE snapshots ADD COLUMN {column} {kind}")
+            # values are converted in Python, and only those SQLite can hold exactly move to a
+            # typed column; the rest (e.g. 2**70, "nan") stay as text under a *_text tag
+            moved = []
+            for rid, rtype, text in self.conn.execute(
+                    "SELECT id, value_type, value_text FROM snapshots WHERE value_type IN ('int', 'float')"):
+                try:
+                    tag, *columns = encode_value(int(text) if rtype == "int" else float(text))
+                except (TypeError, ValueError):
+                    continue            # not a number after all: leave the row untouched
+                moved.append((tag, *columns, rid))
+            self.conn.executemany("UPDATE snapshots SET value_type = ?, value_int = ?, value_real = ?, "
+                                  "value_text = ?, value_blob = ? WHERE id = ?", moved)
+
+    def insert_many(self, items):
+        # items: iterable of (name, value) pairs, written in ONE transaction
+        self.insert_encoded((name, *encode_value(value)) for name, value in items)
+
+    def insert_encoded(self, rows):
+        # rows: (name, *encode_value(value)) tuples that were already encoded by the caller
+        with self.conn:   # commits on success, rolls back on error
+            self.conn.executemany(
+                "INSERT INTO snapshots (name, value_type, value_int, value_real, value_text, value_blob) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def iter_snapshots(self, name=None):
+        # yields (id, name, value, value_type, created_at) with the value already decoded.
+        # Only one value column is set per row, so COALESCE returns it with its native SQLite
+        # type (int/float/str/bytes). Iterating the cursor streams rows instead of fetchall().
+        columns = ("id, name, value_type, COALESCE(value_int, value_real, value_text, value_blob), "
+                   "created_at")
+        if name is None:
+            cur = self.conn.execute(f"SELECT {columns} FROM snapshots")
+        else:
+            cur = self.conn.execute(f"SELECT {columns} FROM snapshots WHERE name = ? ORDER BY created_at",
+                                    (name,))
+        # only tags with a decode function need any per-row work
+        decoders = {tag: decode for tag, (_, decode) in _SNAPSHOT_DECODERS.items() if decode is not None}
+        for rid, rname, rtype, value, created_at in cur:
+            decode = decoders.get(rtype)
+            if decode is not None:
+                value = decode(value)
+            yield rid, rname, value, rtype, created_at
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# -----------------------------
+# 9c) Sharing the database between threads (connection pool + single writer)
+# -----------------------------
+# Opening a connection per call repeats the open cost, and many threads writing at once
+# fight over SQLite's single write lock ("database is locked").
+#   - ConnectionPool gives every thread ONE reusable SnapshotStore (threading.local), so
+#     each reader thread opens its connection once and WAL lets them all read in parallel.
+#     Stores of threads that have exited are closed the next time a thread opens one, so
+#     the pool holds at most one connection per LIVE thread even when threads come and go.
+#   - SnapshotService has ONE writer thread. Producers encode the value on their own thread
+#     (a value that cannot be stored raises right there, in submit()) and put the encoded row
+#     on a queue; the writer drains up to batch_size rows and writes them in one transaction.
+#     submit() returns a Future that completes once the row is committed.
+import queue
+import threading
+from concurrent.futures import Future
+
+class ConnectionPool:
+    def __init__(self, path="variables_demo.db"):
+        self.path = path
+        self.local = threading.local()
+        self.stores = {}    # thread -> its store
+        self.lock = threading.Lock()
+
+    def store(self):
+        store = getattr(self.local, "store", None)
+        if store is None:
+            # check_same_thread=False so close_all() and the cleanup below can close it from
+            # another thread
+            store = SnapshotStore(self.path, check_same_thread=False)
+            self.local.store = store
+            with self.lock:
+                for thread in [t for t in self.stores if not t.is_alive()]:
+                    self.stores.pop(thread).close()
+                self.stores[threading.current_thread()] = store
+        return store
+
+    def close_all(self):
+        with self.lock:
+            for store in self.stores.values():
+                store.close()
+            self.stores.clear()
+            # a fresh threading.local drops every thread's reference to a closed store, so the
+            # next store() call in any thread opens a new connection
+            self.local = threading.local()
+
+class SnapshotService:
+    _STOP = object()
+
+    def __init__(self, path="variables_demo.db", batch_size=1000):
+        self.pool = ConnectionPool(path)
+        self.batch_size = batch_size
+        self.pending = queue.Queue()
+        self.closed = False
+        self.close_lock = threading.Lock()
+        self.writer = threading.Thread(target=self._write_loop, name="snapshot-writer", daemon=True)
+        self.writer.start()
+
+    def submit(self, name, value):
+        row = (name, *encode_value(value))   # raises here for a value that cannot be stored
+        future = Future()
+        with self.close_lock:
+            if self.closed:
+                raise RuntimeError("submit() after close()")
+            self.pending.put((row, future))
+        return future
+
+    def read(self, name=None):
+        # runs on the caller's thread with that thread's pooled connection
+        return self.pool.store().iter_snapshots(name)
+
+    def _write_loop(self):
+        store = self.pool.store()
+        while True:
+            item = self.pending.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.pending.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                store.insert_encoded(row for row, _ in batch)
+            except Exception as error:
+                for _, future in batch:
+                    future.set_exception(error)
+            else:
+                for _, future in batch:
+                    future.set_result(None)
+            if stop:
+                return
+
+    def close(self):
+        # everything submitted before close() is still written
+        with self.close_lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.pending.put(self._STOP)
+        self.writer.join()
+        self.pool.close_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 def db_demo():
-    # Connect to a SQLite database file (it will be created if not exists)
-    conn = sqlite3.connect("variables_demo.db")
-    cur = conn.cursor()
-
-    # Create a simple table to store variable snapshots
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS snapshots (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        value_text TEXT,
-        value_type TEXT,
-        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-    )
-    """)
+    # Connect to a SQLite database file (it will be created if not exists); the pool hands
+    # this thread its one reusable connection
+    pool = ConnectionPool("variables_demo.db")
+    store = pool.store()
 
     # Example variables to store
     username = name                 # string variable
     score = 95                      # int variable
     meta = {"lang": "python", "level": "beginner"}  # dict -> needs serialization
 
-    # When storing, convert to text safely. We store the type to interpret on read.
-    cur.execute("INSERT INTO snapshots (name, value_text, value_type) VALUES (?, ?, ?)",
-                ("username", username, "str"))
-    cur.execute("INSERT INTO snapshots (name, value_text, value_type) VALUES (?, ?, ?)",
-                ("score", str(score), "int"))
-    # store JSON for complex objects
-    cur.execute("INSERT INTO snapshots (name, value_text, value_type) VALUES (?, ?, ?)",
-                ("meta", json.dumps(meta), "json"))
-
-    conn.commit()
+    # All three rows go in with one executemany() inside one transaction.
+    store.insert_many([("username", username), ("score", score), ("meta", meta)])
 
-    # Query back
-    cur.execute("SELECT id, name, value_text, value_type, created_at FROM snapshots")
-    rows = cur.fetchall()
+    # Query back (values are decoded based on the stored type)
     print("\n--- DB Snapshots ---")
-    for row in rows:
-        rid, rname, rvalue_text, rtype, created_at = row
-        # interpret based on rtype
-        if rtype == "int":
-            rvalue = int(rvalue_text)
-        elif rtype == "float":
-            rvalue = float(rvalue_text)
-        elif rtype == "json":
-            rvalue = json.loads(rvalue_text)
-        else:
-            rvalue = rvalue_text  # str or fallback
-
+    for rid, rname, rvalue, rtype, created_at in store.iter_snapshots():
         print(f"{rid}: {rname} ({rtype}) = {rvalue}   inserted_at: {created_at}")
 
     # Clean up
-    conn.close()
+    pool.close_all()
+
+# Benchmark: rows/sec with one INSERT per row vs the batched SnapshotStore.
+#   Run with:  python "03Varriable&Expression.py" --bench
+def benchmark_snapshots(n=200_000):
+    import os
+    import tempfile
+    import time
+
+    items = [(f"var{i % 100}", i) for i in range(n)]
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "before.db"))
+        conn.execute("CREATE TABLE snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+                     "value_text TEXT, value_type TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)")
+        # one execute + commit per snapshot, default rollback journal, no index
+        # (fewer rows here: on a real disk every commit waits for an fsync)
+        before_items = items[:n // 10]
+        start = time.perf_counter()
+        cur = conn.cursor()
+        for var_name, value in before_items:
+            cur.execute("INSERT INTO snapshots (name, value_text, value_type) VALUES (?, ?, ?)",
+                        (var_name, str(value), "int"))
+            conn.commit()
+        before = len(before_items) / (time.perf_counter() - start)
+        conn.close()
+
+        with SnapshotStore(os.path.join(tmp, "after.db")) as store:
+            start = time.perf_counter()
+            store.insert_many(items)
+            after = n / (time.perf_counter() - start)
+            start = time.perf_counter()
+            read = sum(1 for _ in store.iter_snapshots())
+            read_rate = read / (time.perf_counter() - start)
+
+    print(f"\nSnapshot writes ({n:,} rows)")
+    print(f"  execute per row       {before:12,.0f} rows/sec")
+    print(f"  SnapshotStore batch   {after:12,.0f} rows/sec")
+    print(f"  iter_snapshots read   {read_rate:12,.0f} rows/sec")
+
+# Benchmark: reading mixed snapshots stored as TEXT + if/elif parsing vs typed columns.
+def benchmark_typed_reads(n=1_000_000):
+    import os
+    import tempfile
+    import time
+
+    def sample(i):
+        if i % 10 == 0:
+            return {"lang": "python", "level": i}
+        return i if i % 2 else i * 0.5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "text.db"))
+        conn.execute("CREATE TABLE snapshots (id INTEGER PRIMARY KEY, name TEXT, value_text TEXT, value_type TEXT)")
+        with conn:
+            conn.executemany("INSERT INTO snapshots (name, value_text, value_type) VALUES (?, ?, ?)",
+                             (("v", json.dumps(v), "json") if isinstance(v, dict)
+                              else ("v", repr(v), type(v).__name__) for v in map(sample, range(n))))
+        start = time.perf_counter()
+        cur = conn.execute("SELECT id, name, value_text, value_type FROM snapshots")
+        for rid, rname, rvalue_text, rtype in cur:
+            if rtype == "int":
+                rvalue = int(rvalue_text)
+            elif rtype == "float":
+                rvalue = float(rvalue_text)
+            elif rtype == "json":
+                rvalue = json.loads(rvalue_text)
+            else:
+                rvalue = rvalue_text
+        text_rate = n / (time.perf_counter() - start)
+        conn.close()
+
+        with SnapshotStore(os.path.join(tmp, "typed.db")) as store:
+            store.insert_many(("v", sample(i)) for i in range(n))
+            start = time.perf_counter()
+            for _ in store.iter_snapshots():
+                pass
+            typed_rate = n / (time.perf_counter() - start)
+
+    print(f"\nReading {n:,} snapshots (80% numbers, 10% dicts)")
+    print(f"  TEXT + if/elif parsing  {text_rate:12,.0f} rows/sec")
+    print(f"  typed columns           {typed_rate:12,.0f} rows/sec")
+
+# Load test: 16 producer threads submit snapshots while 4 reader threads scan the table.
+# Latency = time from submit() until the row is committed.
+def load_test_snapshot_service(producers=16, per_producer=2_000, readers=4):
+    import os
+    import tempfile
+    import time
+
+    latencies = []
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def produce(worker, service):
+        mine = []
+        for i in range(per_producer):
+            start = time.perf_counter()
+            service.submit(f"worker{worker}", i).result()
+            mine.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(mine)
+
+    def read(service):
+        while not done.is_set():
+            for _ in service.read("worker0"):
+                pass
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with SnapshotService(os.path.join(tmp, "service.db")) as service:
+            reader_threads = [threading.Thread(target=read, args=(service,)) for _ in range(readers)]
+            producer_threads = [threading.Thread(target=produce, args=(w, service)) for w in range(producers)]
+            start = time.perf_counter()
+            for t in reader_threads + producer_threads:
+                t.start()
+            for t in producer_threads:
+                t.join()
+            elapsed = time.perf_counter() - start
+            done.set()
+            for t in reader_threads:
+                t.join()
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"\nSnapshotService load test ({producers} producers, {readers} readers, {total:,} writes)")
+    print(f"  throughput  {total / elapsed:12,.0f} writes/sec")
+    print(f"  p50 latency {latencies[total // 2] * 1000:12.3f} ms")
+    print(f"  p99 latency {latencies[int(total * 0.99)] * 1000:12.3f} ms")
 
 # Run the DB demo if file executed directly
 if __name__ == "__main__":
@@ -209,6 +649,12 @@ if __name__ == "__main__":
     print(message)
     db_demo()
 
+    import sys
+    if "--bench" in sys.argv:
+        benchmark_snapshots()
+        benchmark_typed_reads()
+        load_test_snapshot_service()
+
 # -----------------------------
 # 10) Common DSA-style questions on variables & expressions (and answers)
 # -----------------------------
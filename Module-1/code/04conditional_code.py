@@ -174,8 +174,8 @@ def is_even(n):
 # Problem 2:
 # Determine if a number is prime.
 # Conditions + Loop (basic DSA)
-# Time Complexity: O(n) simple method, better solutions exist.
-def is_prime(n):
+# Time Complexity: O(n) simple method, kept for comparison with is_prime below.
+def is_prime_trial(n):
     if n <= 1:
         return False
     for i in range(2, n):
@@ -183,6 +183,140 @@ def is_prime(n):
             return False
     return True
 
+# Problem 2b:
+# Faster prime check: deterministic Miller-Rabin.
+# Write n - 1 = d * 2^s with d odd. For a base a, n "passes" if
+#   a^d % n == 1   or   a^(d * 2^r) % n == n - 1 for some 0 <= r < s.
+# A composite n fails for most bases; for every n < 2^64 the first 12 prime
+# bases below are proven to catch all composites, so the answer is exact.
+# Time Complexity: O(k * log^3 n) with k = 12 bases (pow() does the heavy lifting).
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def is_prime(n):
+    if n < 2:
+        return False
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+# Problem 2c:
+# All primes in [lo, hi) with a SEGMENTED sieve.
+# 1) sieve the small primes up to sqrt(hi)
+# 2) walk [lo, hi) in fixed-size segments; in each segment cross out multiples
+#    of the small primes, then yield whatever is left.
+# Memory stays O(sqrt(hi) + segment_size) no matter how wide the range is.
+# math.isqrt is the exact integer square root; int(x ** 0.5) goes through a float and can be
+# off by one for large x, which would leave a prime factor out of the small-prime list.
+from math import isqrt
+
+def _simple_sieve(limit):
+    # bytearray bitmap: flags[i] == 1 means i is prime (for 0 <= i <= limit)
+    flags = bytearray([1]) * (limit + 1)
+    flags[0:2] = b"\x00\x00"[:limit + 1]
+    for i in range(2, isqrt(limit) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return flags
+
+def primes_in_range(lo, hi, segment_size=1 << 16):
+    lo = max(lo, 2)
+    if hi <= lo:
+        return
+    root = isqrt(hi - 1)
+    small = [i for i, flag in enumerate(_simple_sieve(root)) if flag]
+    for start in range(lo, hi, segment_size):
+        stop = min(start + segment_size, hi)
+        segment = bytearray([1]) * (stop - start)
+        for p in small:
+            first = max(p * p, (start + p - 1) // p * p)
+            if first >= stop:
+                continue
+            segment[first - start::p] = bytes(len(range(first, stop, p)))
+        for offset, flag in enumerate(segment):
+            if flag:
+                yield start + offset
+
+# Problem 2d:
+# Bulk prime lookups: is_prime_many(values)
+# Small values are answered from a cached sieve bitmap (one index per lookup);
+# the bitmap grows (doubling) up to _SIEVE_CACHE_LIMIT. Larger values use Miller-Rabin.
+# If NumPy is installed and 'values' is an ndarray, the lookup is fully vectorized.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_SIEVE_CACHE_LIMIT = 1 << 24
+_sieve_cache = bytearray()
+
+def _sieve_bitmap(limit):
+    global _sieve_cache
+    if len(_sieve_cache) <= limit:
+        size = max(limit, 2 * len(_sieve_cache), 1024)
+        _sieve_cache = _simple_sieve(min(size, _SIEVE_CACHE_LIMIT))
+    return _sieve_cache
+
+def is_prime_many(values):
+    if np is not None and isinstance(values, np.ndarray):
+        # uint64 and object (Python int) arrays are compared as they are: a cast to int64 would
+        # wrap values above 2**63 - 1. Only the sieve range, which fits any int type, is cast.
+        if values.dtype.kind not in "iuO":
+            values = values.astype(np.int64)
+        result = np.zeros(values.shape, dtype=bool)
+        if values.size == 0:
+            return result
+        small = ((values >= 0) & (values <= _SIEVE_CACHE_LIMIT)).astype(bool, copy=False)
+        if small.any():
+            small_values = values[small].astype(np.int64)
+            bitmap = np.frombuffer(_sieve_bitmap(int(small_values.max())), dtype=np.uint8)
+            result[small] = bitmap[small_values].astype(bool)
+        for idx in np.flatnonzero(~small):
+            result.flat[idx] = is_prime(int(values.flat[idx]))
+        return result
+    values = list(values)
+    small_values = [v for v in values if 0 <= v <= _SIEVE_CACHE_LIMIT]
+    bitmap = _sieve_bitmap(max(small_values)) if small_values else b""
+    return [bool(bitmap[v]) if 0 <= v <= _SIEVE_CACHE_LIMIT else is_prime(v)
+            for v in values]
+
+# Benchmark: throughput of the trial-division check vs the new prime engine.
+#   Run with:  python 04conditional_code.py --bench
+def benchmark_primes(count=2_000, trial_limit=20_000):
+    import random
+    import time
+
+    def rate(label, fn, n):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<36} {n / elapsed:14,.0f} numbers/sec")
+
+    print("\nPrime engine benchmark")
+    nums = [random.randrange(2, trial_limit) for _ in range(count)]
+    rate("is_prime_trial (n < 2e4)", lambda: [is_prime_trial(v) for v in nums], count)
+    rate("is_prime Miller-Rabin (n < 2e4)", lambda: [is_prime(v) for v in nums], count)
+    rate("is_prime_many sieve (n < 2e4)", lambda: is_prime_many(nums), count)
+    big = [random.randrange(10**9, 10**18) for _ in range(count)]
+    rate("is_prime Miller-Rabin (n < 1e18)", lambda: [is_prime(v) for v in big], count)
+    span = 10**6
+    rate("primes_in_range [1e9, 1e9+1e6)", lambda: sum(1 for _ in primes_in_range(10**9, 10**9 + span)), span)
+
 # Problem 3:
 # Check maximum of 3 numbers using conditionals.
 # Time Complexity: O(1)
@@ -238,6 +372,15 @@ if __name__ == "__main__":
     assert is_prime(2) == True
     assert is_prime(9) == False
 
+    # Test the prime engine against trial division
+    assert [n for n in range(200) if is_prime(n)] == [n for n in range(200) if is_prime_trial(n)]
+    assert is_prime(1_000_000_007) == True
+    assert is_prime(3_215_031_751) == False          # strong pseudoprime to bases 2, 3, 5, 7
+    assert is_prime(18_446_744_073_709_551_557) == True   # largest 64-bit prime
+    assert list(primes_in_range(0, 30)) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert list(primes_in_range(90, 110, segment_size=7)) == [97, 101, 103, 107, 109]
+    assert is_prime_many([0, 1, 2, 9, 97, 1_000_000_007]) == [False, False, True, False, True, True]
+
     # Test max_of_three
     assert max_of_three(10, 5, 2) == 10
     assert max_of_three(1, 9, 3) == 9
@@ -253,6 +396,10 @@ if __name__ == "__main__":
 
     print("All tests passed successfully ✔️")
 
+    import sys
+    if "--bench" in sys.argv:
+        benchmark_primes()
+
 # ----------------------------------------------------------
 # END OF FILE
 # ----------------------------------------------------------
@@ -210,6 +210,174 @@ def sliding_window_max_naive(nums, k):
         res.append(window_max)
     return res
 
+# Problem C2: Sliding Window Maximum (optimal, monotonic deque)
+#   Keep a deque of indices whose values are in decreasing order.
+#   - the front of the deque is always the max of the current window
+#   - before pushing a new value, pop smaller values from the back (they can never be a max again)
+#   - pop the front once it falls out of the window
+#   Every index is pushed and popped at most once -> Time: O(n), Space: O(k).
+#
+#   The engine below works on ANY iterable (even an endless stream) and yields
+#   each window result as soon as the window is full, so memory stays O(k).
+import math
+from collections import deque
+
+
+def _monotonic_window(iterable, k, better):
+    # better(new, old) -> True if 'new' should evict 'old' from the back of the deque
+    if k <= 0:
+        return
+    window = deque()   # (index, value) pairs, values monotonic from front to back
+    for i, x in enumerate(iterable):
+        while window and better(x, window[-1][1]):
+            window.pop()
+        window.append((i, x))
+        if window[0][0] <= i - k:
+            window.popleft()
+        if i >= k - 1:
+            yield window[0][1]
+
+
+def sliding_window_max_stream(iterable, k):
+    # generator version: yields the max of each window as it arrives
+    return _monotonic_window(iterable, k, lambda new, old: new >= old)
+
+
+def sliding_window_min_stream(iterable, k):
+    return _monotonic_window(iterable, k, lambda new, old: new <= old)
+
+
+def sliding_window_sum_stream(iterable, k):
+    # running total: add the new value, subtract the value leaving the window. O(1) per item.
+    # With floats a plain running total drifts: [1e16, 1, 1, 1] with k=2 would give
+    # [1e16, 0, 0] because the 1s were rounded away while 1e16 was in the total. So the
+    # rounding error of every step is kept in 'lost' (Neumaier compensated summation) and
+    # added back, and every k items both are re-anchored with exact math.fsum() sums of the
+    # window, so errors cannot pile up over a long stream. Ints stay exact ('lost' stays 0).
+    if k <= 0:
+        return
+    window = deque()
+    total = 0
+    lost = 0
+    steps = 0           # float windows since the last re-anchor
+    for x in iterable:
+        window.append(x)
+        new_total = total + x
+        if type(new_total) is float and -math.inf < new_total < math.inf:
+            lost += (total - new_total) + x if abs(total) >= abs(x) else (x - new_total) + total
+        total = new_total
+        if len(window) > k:
+            x = -window.popleft()
+            new_total = total + x
+            if type(new_total) is float and -math.inf < new_total < math.inf:
+                lost += (total - new_total) + x if abs(total) >= abs(x) else (x - new_total) + total
+            total = new_total
+        if len(window) == k:
+            if type(total) is float:
+                steps += 1
+                # also right after an inf left the window: inf - inf made the total nan
+                if steps >= k or not -math.inf < total < math.inf:
+                    steps = 0
+                    try:
+                        # the correctly rounded total, plus what rounding it left out
+                        total = math.fsum(window)
+                        lost = math.fsum((*window, -total))
+                    except (ValueError, OverflowError):      # inf - inf or an overflowing sum
+                        pass
+            yield total + lost
+
+
+def sliding_window_mean_stream(iterable, k):
+    for total in sliding_window_sum_stream(iterable, k):
+        yield total / k
+
+
+def sliding_window_max(nums, k):
+    return list(sliding_window_max_stream(nums, k))
+
+
+def sliding_window_min(nums, k):
+    return list(sliding_window_min_stream(nums, k))
+
+
+def sliding_window_sum(nums, k):
+    return list(sliding_window_sum_stream(nums, k))
+
+
+def sliding_window_mean(nums, k):
+    return list(sliding_window_mean_stream(nums, k))
+
+
+# Problem C3: Sliding window over a whole array with NumPy (vectorized)
+#   NumPy is optional: if it is not installed we fall back to the deque engine above.
+#   - The array is cut into blocks of k items (van Herk / Gil-Werman). A window always covers
+#     the tail of one block and the head of the next, so a running max/min/sum over every
+#     block from the left (head) and from the right (tail) gives all windows in O(n).
+#     (sliding_window_view(arr, k).max(axis=1) would look at all k items of every window:
+#     O(n*k), slow for large k.)
+#   - sum/mean: the running sums restart at every block, so a float window sum only rounds
+#     against values near the window, not against the sum of everything before it as one
+#     global cumsum would.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def sliding_window_np(nums, k, op="max"):
+    if np is None:
+        fallback = {"max": sliding_window_max, "min": sliding_window_min,
+                    "sum": sliding_window_sum, "mean": sliding_window_mean}
+        return fallback[op](nums, k)
+    arr = np.asarray(nums)
+    if op not in ("max", "min", "sum", "mean"):
+        raise ValueError(f"unknown op: {op}")
+    if k <= 0 or k > len(arr):
+        return arr[:0]
+    # pad to whole blocks; the padding is never part of a window's result
+    blocks = np.concatenate((arr, np.repeat(arr[-1:], -len(arr) % k))).reshape(-1, k)
+    scan = {"max": np.maximum.accumulate, "min": np.minimum.accumulate}.get(op, np.cumsum)
+    count = len(arr) - k + 1
+    head = scan(blocks, axis=1).ravel()[k - 1:k - 1 + count]
+    tail = scan(blocks[:, ::-1], axis=1)[:, ::-1].ravel()[:count]
+    if op == "max":
+        return np.maximum(tail, head)
+    if op == "min":
+        return np.minimum(tail, head)
+    head[::k] = 0        # a window that starts a block is that whole block: tail only
+    sums = tail + head
+    return sums if op == "sum" else sums / k
+
+
+# Benchmark: compare the naive O(n*k) version with the deque and NumPy versions.
+#   Run with:  python 06loops_and_iteration.py --bench
+def benchmark_sliding_window(n=20_000, k=500):
+    import random
+    import time
+
+    nums = [random.randint(-10**6, 10**6) for _ in range(n)]
+    print(f"\nSliding window benchmark (n={n}, k={k})")
+
+    def timeit(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<22} {elapsed * 1000:10.2f} ms")
+        return result
+
+    expected = timeit("naive max", lambda: sliding_window_max_naive(nums, k))
+    assert timeit("deque max", lambda: sliding_window_max(nums, k)) == expected
+    timeit("deque min", lambda: sliding_window_min(nums, k))
+    timeit("deque sum", lambda: sliding_window_sum(nums, k))
+    timeit("deque mean", lambda: sliding_window_mean(nums, k))
+    timeit("stream max (gen)", lambda: sum(1 for _ in sliding_window_max_stream(iter(nums), k)))
+    if np is not None:
+        arr = np.array(nums)
+        assert list(timeit("numpy max", lambda: sliding_window_np(arr, k, "max"))) == expected
+        timeit("numpy sum", lambda: sliding_window_np(arr, k, "sum"))
+    else:
+        print("  (numpy not installed, skipping vectorized path)")
+
 # Problem D: Detect cycle in list using Floyd's Tortoise and Hare (while loop)
 #   Given a singly linked list defined by next pointers (simulated with dict mapping),
 #   detect if there's a cycle. Uses iteration with two pointers. Time O(n), Space O(1).
@@ -257,6 +425,23 @@ def run_tests():
     assert sliding_window_max_naive([1,3,-1,-3,5,3,6,7], 3) == [3,3,5,5,6,7]
     assert sliding_window_max_naive([1,2], 1) == [1,2]
 
+    # sliding window engine (deque / streaming / numpy)
+    assert sliding_window_max([1,3,-1,-3,5,3,6,7], 3) == [3,3,5,5,6,7]
+    assert sliding_window_max([1,2], 1) == [1,2]
+    assert sliding_window_max([1,2], 3) == []
+    assert sliding_window_max([1,2], 0) == []
+    assert sliding_window_min([1,3,-1,-3,5,3,6,7], 3) == [-1,-3,-3,-3,3,3]
+    assert sliding_window_sum([1,2,3,4], 2) == [3,5,7]
+    assert sliding_window_mean([1,2,3,4], 2) == [1.5,2.5,3.5]
+    assert sliding_window_sum([1e16,1,1,1], 2) == [1e16,2,2]        # no float drift
+    assert sliding_window_sum([0.1] * 10, 3) == [0.30000000000000004] * 8
+    stream = sliding_window_max_stream(iter(range(10**9)), 3)   # endless-style input
+    assert [next(stream) for _ in range(3)] == [2,3,4]
+    assert list(sliding_window_np([1,3,-1,-3,5,3,6,7], 3, "max")) == [3,3,5,5,6,7]
+    assert list(sliding_window_np([1,2,3,4], 2, "sum")) == [3,5,7]
+    assert list(sliding_window_np([1e16,1,1,1], 2, "sum")) == [1e16,2,2]
+    assert list(sliding_window_np([4,1,3,2,5], 2, "min")) == [1,1,2,2]
+
     # detect_cycle: simulate nodes with dict mapping
     # Example: 1->2->3->4->2 (cycle)
     next_map_cycle = {1:2, 2:3, 3:4, 4:2}
@@ -294,6 +479,10 @@ if __name__ == "__main__":
     # run tests
     run_tests()
 
+    import sys
+    if "--bench" in sys.argv:
+        benchmark_sliding_window()
+
 # ----------------------------------------------------------
 # END OF FILE
 # ----------------------------------------------------------